@@ -2,13 +2,16 @@
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable
 from datetime import datetime, timedelta
 import asyncpg
 import psycopg
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, tuple_row
 try:
     from psycopg_pool import AsyncConnectionPool
 except ImportError:
@@ -17,6 +20,9 @@ except ImportError:
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)  # Only log warnings and errors
 
+# Statements that can be declared as a server-side cursor
+_STREAMABLE_RE = re.compile(r'^\s*(SELECT|WITH|VALUES|TABLE)\b', re.IGNORECASE)
+
 
 class ConnectionStatus(Enum):
     """Connection status indicators."""
@@ -42,10 +48,28 @@ class DatabaseConfig:
     query_timeout: int = 30
     pool_size: int = 5
     min_pool_size: int = 2
+    pool_max_idle: int = 300  # seconds before an idle pooled connection is closed
     retry_attempts: int = 3
     retry_delay: int = 1000  # milliseconds
     health_check_interval: int = 30  # seconds
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DatabaseConfig":
+        """Build a config from a YAML/env mapping.
+        
+        Unknown keys are ignored with a warning and integer fields given as
+        strings (e.g. port: "5432" from an env var) are converted.
+        """
+        kwargs = {}
+        for key, value in data.items():
+            if key not in _CONFIG_FIELDS:
+                logger.warning("Ignoring unknown option '%s' for database %s", key, data.get('name', 'unknown'))
+                continue
+            if key in _CONFIG_INT_FIELDS and isinstance(value, str):
+                value = int(value)
+            kwargs[key] = value
+        return cls(**kwargs)
+    
     def get_dsn(self) -> str:
         """Build PostgreSQL connection DSN."""
         params = [
@@ -60,6 +84,11 @@ class DatabaseConfig:
         return " ".join(params)
 
 
+# Field metadata for DatabaseConfig.from_dict, computed once
+_CONFIG_FIELDS = frozenset(f.name for f in fields(DatabaseConfig))
+_CONFIG_INT_FIELDS = frozenset(f.name for f in fields(DatabaseConfig) if f.type in (int, 'int'))
+
+
 @dataclass
 class DatabaseConnection:
     """Represents a single database connection with its state."""
@@ -83,6 +112,7 @@ class DatabaseConnection:
                 self.config.get_dsn(),
                 min_size=self.config.min_pool_size,
                 max_size=self.config.pool_size,
+                max_idle=self.config.pool_max_idle,
                 timeout=self.config.connection_timeout,
                 kwargs={"row_factory": dict_row},
                 open=False  # Don't open in constructor
@@ -101,7 +131,7 @@ class DatabaseConnection:
             self.retry_count = 0
             self._notify_callbacks()
             
-            logger.info(f"Connected to database: {self.config.name}")
+            logger.info("Connected to database: %s", self.config.name)
             return True
             
         except Exception as e:
@@ -110,7 +140,7 @@ class DatabaseConnection:
             self.retry_count += 1
             self._notify_callbacks()
             
-            logger.error(f"Failed to connect to {self.config.name}: {e}")
+            logger.error("Failed to connect to %s: %s", self.config.name, e)
             return False
     
     async def disconnect(self) -> None:
@@ -121,7 +151,7 @@ class DatabaseConnection:
         
         self.status = ConnectionStatus.DISCONNECTED
         self._notify_callbacks()
-        logger.info(f"Disconnected from database: {self.config.name}")
+        logger.info("Disconnected from database: %s", self.config.name)
     
     async def health_check(self) -> bool:
         """Check if the connection is healthy."""
@@ -136,16 +166,20 @@ class DatabaseConnection:
             return True
             
         except Exception as e:
-            logger.warning(f"Health check failed for {self.config.name}: {e}")
+            logger.warning("Health check failed for %s: %s", self.config.name, e)
             self.status = ConnectionStatus.DISCONNECTED
             self.last_error = str(e)
             self._notify_callbacks()
             return False
     
+    def get_stats(self) -> Dict[str, int]:
+        """Pool statistics (sizes, waiting clients, connection counters), or {} if not connected."""
+        return self.pool.get_stats() if self.pool else {}
+    
     async def reconnect(self) -> bool:
         """Attempt to reconnect to the database."""
         if self.retry_count >= self.config.retry_attempts:
-            logger.error(f"Max retry attempts reached for {self.config.name}")
+            logger.error("Max retry attempts reached for %s", self.config.name)
             return False
         
         self.status = ConnectionStatus.RECONNECTING
@@ -168,7 +202,7 @@ class DatabaseConnection:
             try:
                 callback(self)
             except Exception as e:
-                logger.error(f"Callback error: {e}")
+                logger.error("Callback error: %s", e)
     
     def get_status_emoji(self) -> str:
         """Get emoji representation of connection status."""
@@ -186,10 +220,16 @@ class DatabaseConnection:
 class ConnectionManager:
     """Manages multiple database connections."""
     
+    # Recent results of the table SELECTs the app builds, kept for sort/filter re-runs
+    RESULT_CACHE_SIZE = 64
+    RESULT_CACHE_TTL = 30.0  # seconds
+    
     def __init__(self):
         self.connections: Dict[str, DatabaseConnection] = {}
         self.active_connection: Optional[str] = None
         self._health_check_task: Optional[asyncio.Task] = None
+        self._connect_tasks: Dict[str, asyncio.Task] = {}  # In-flight connects by name
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (fetched_at, rows)
     
     def add_database(self, config: DatabaseConfig) -> None:
         """Add a database configuration."""
@@ -217,20 +257,29 @@ class ConnectionManager:
             for name, task in tasks:
                 results[name] = await task
         
-        # Start health check task
-        if not self._health_check_task:
-            self._health_check_task = asyncio.create_task(self._health_check_loop())
+        self.start_health_checks()
         
         return results
     
+    def start_health_checks(self) -> None:
+        """Start the background health check loop if it isn't running."""
+        if not self._health_check_task:
+            self._health_check_task = asyncio.create_task(self._health_check_loop())
+    
     async def connect_database(self, name: str) -> bool:
         """Connect to a specific database."""
         if name not in self.connections:
-            logger.error(f"Database {name} not configured")
+            logger.error("Database %s not configured", name)
             return False
         
-        conn = self.connections[name]
-        return await conn.connect()
+        # Share an in-flight connect so concurrent callers don't open two pools
+        task = self._connect_tasks.get(name)
+        if task is None:
+            task = asyncio.ensure_future(self.connections[name].connect())
+            self._connect_tasks[name] = task
+            task.add_done_callback(lambda _: self._connect_tasks.pop(name, None))
+        # Shielded so a cancelled caller doesn't cancel the connect for the others
+        return await asyncio.shield(task)
     
     async def disconnect_database(self, name: str) -> None:
         """Disconnect from a specific database."""
@@ -249,9 +298,13 @@ class ConnectionManager:
         await asyncio.gather(*tasks, return_exceptions=True)
     
     def switch_database(self, name: str) -> bool:
-        """Switch active database."""
+        """Switch the default database for calls that don't name one.
+        
+        Each database keeps its own pool, so this only selects which pool
+        unqualified queries use.
+        """
         if name not in self.connections:
-            logger.error(f"Database {name} not configured")
+            logger.error("Database %s not configured", name)
             return False
         
         self.active_connection = name
@@ -267,14 +320,45 @@ class ConnectionManager:
         self, 
         query: str, 
         params: Optional[tuple] = None,
-        database: Optional[str] = None
+        database: Optional[str] = None,
+        prepare: Optional[bool] = None,
+        as_tuples: bool = False,
+        use_cache: bool = False
     ) -> Optional[List[Dict[str, Any]]]:
-        """Execute a query on the active or specified database."""
+        """Execute a query on the active or specified database.
+        
+        Pass prepare=True for statements that are re-run with the same text so
+        psycopg prepares them server-side on first use instead of after its
+        default threshold. With as_tuples=True rows come back as plain tuples in
+        select-list order, skipping the per-row dict build. use_cache=True is for
+        the SELECTs the app builds itself: the result is cached, and an identical
+        query run within RESULT_CACHE_TTL seconds is answered from that cache.
+        """
         db_name = database or self.active_connection
         if not db_name or db_name not in self.connections:
             logger.error("No active database connection")
             return None
         
+        key = self._result_key(db_name, query, params, as_tuples)
+        if use_cache:
+            cached = self._cached_result(key)
+            if cached is not None:
+                return cached
+        
+        rows = await self._execute_query(db_name, query, params, prepare, as_tuples)
+        if use_cache:
+            self._remember_result(key, rows)
+        return rows
+    
+    async def _execute_query(
+        self,
+        db_name: str,
+        query: str,
+        params: Optional[tuple],
+        prepare: Optional[bool],
+        as_tuples: bool
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Run a query on a named database, bypassing the result cache."""
         conn = self.connections[db_name]
         
         # Ensure connected
@@ -284,23 +368,218 @@ class ConnectionManager:
         
         try:
             async with conn.pool.connection() as db_conn:
-                async with db_conn.cursor() as cursor:
-                    await cursor.execute(query, params or ())
+                row_factory = tuple_row if as_tuples else None
+                async with db_conn.cursor(row_factory=row_factory) as cursor:
+                    await cursor.execute(query, params or (), prepare=prepare)
                     
                     # Check if query returns results
                     if cursor.description:
                         rows = await cursor.fetchall()
                         # The connection already has dict_row factory, so rows should be dicts
                         # But if they're not, convert them
-                        if rows and not isinstance(rows[0], dict):
+                        if rows and not as_tuples and not isinstance(rows[0], dict):
                             columns = [desc.name for desc in cursor.description]
                             return [dict(zip(columns, row)) for row in rows]
                         return rows
                     return []
                     
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
+            raise
+    
+    async def execute_query_stream(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        limit: int = 1000,
+        database: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Execute a query and fetch at most `limit` rows through a server-side cursor.
+        
+        Only row-returning statements can be declared as cursors, so anything
+        else is delegated to execute_query(). When the server refuses the DECLARE
+        (a WITH holding INSERT/UPDATE/DELETE, SELECT ... INTO, several statements
+        in one string) the statement is retried once through a regular
+        client-side cursor.
+        
+        This runs user SQL, which may write, so the database's cached results
+        are dropped afterwards.
+        """
+        db_name = database or self.active_connection
+        if not db_name or db_name not in self.connections:
+            logger.error("No active database connection")
+            return None
+        
+        try:
+            if not _STREAMABLE_RE.match(query):
+                return await self.execute_query(query, params, db_name)
+            return await self._execute_query_stream(db_name, query, params, limit)
+        finally:
+            self.invalidate_results(db_name)
+    
+    async def _execute_query_stream(
+        self,
+        db_name: str,
+        query: str,
+        params: Optional[tuple],
+        limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch at most `limit` rows of a query through a server-side cursor."""
+        conn = self.connections[db_name]
+        
+        # Ensure connected
+        if conn.status != ConnectionStatus.CONNECTED:
+            if not await conn.connect():
+                return None
+        
+        try:
+            async with conn.pool.connection() as db_conn:
+                declared = False
+                try:
+                    async with db_conn.transaction():
+                        async with db_conn.cursor(name="pgadmintui_stream") as cursor:
+                            await cursor.execute(query, params or ())
+                            declared = True
+                            return self._as_dicts(cursor, await cursor.fetchmany(limit))
+                except psycopg.Error as e:
+                    # Only a failed DECLARE is retried: nothing has run yet then
+                    if declared:
+                        raise
+                    logger.info("Cannot declare a cursor for query, fetching directly: %s", e)
+                
+                async with db_conn.cursor() as cursor:
+                    await cursor.execute(query, params or ())
+                    if not cursor.description:
+                        return []
+                    return self._as_dicts(cursor, await cursor.fetchmany(limit))
+                    
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
+            raise
+    
+    async def iter_query(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        fetch_size: int = 1000,
+        database: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield a query's rows in batches of up to `fetch_size` dicts.
+        
+        Row-returning statements run through a server-side cursor, so only one
+        batch is held in memory at a time. Anything else falls back to a single
+        execute_query() batch. When the server refuses the DECLARE (a WITH
+        holding INSERT/UPDATE/DELETE, SELECT ... INTO, several statements in one
+        string) the statement is retried once through a regular client-side cursor.
+        
+        This runs user SQL, which may write, so the database's cached results
+        are dropped afterwards.
+        """
+        db_name = database or self.active_connection
+        if not db_name or db_name not in self.connections:
+            logger.error("No active database connection")
+            return
+        
+        try:
+            if not _STREAMABLE_RE.match(query):
+                rows = await self.execute_query(query, params, db_name)
+                if rows:
+                    yield rows
+                return
+            
+            conn = self.connections[db_name]
+            
+            # Ensure connected
+            if conn.status != ConnectionStatus.CONNECTED:
+                if not await conn.connect():
+                    return
+            
+            async with conn.pool.connection() as db_conn:
+                declared = False
+                try:
+                    async with db_conn.transaction():
+                        async with db_conn.cursor(name="pgadmintui_iter", row_factory=dict_row) as cursor:
+                            await cursor.execute(query, params or ())
+                            declared = True
+                            while True:
+                                rows = await cursor.fetchmany(fetch_size)
+                                if not rows:
+                                    break
+                                yield rows
+                    return
+                except psycopg.Error as e:
+                    # Only a failed DECLARE is retried: nothing has run yet then
+                    if declared:
+                        raise
+                    logger.info("Cannot declare a cursor for query, fetching directly: %s", e)
+                
+                async with db_conn.cursor(row_factory=dict_row) as cursor:
+                    await cursor.execute(query, params or ())
+                    if not cursor.description:
+                        return
+                    while True:
+                        rows = await cursor.fetchmany(fetch_size)
+                        if not rows:
+                            break
+                        yield rows
+                    
+        except Exception as e:
+            logger.error("Query execution failed: %s", e)
             raise
+        finally:
+            self.invalidate_results(db_name)
+    
+    @staticmethod
+    def _as_dicts(cursor, rows: list) -> list:
+        """Return fetched rows as dicts keyed by column name."""
+        if rows and not isinstance(rows[0], dict):
+            columns = [desc.name for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in rows]
+        return rows
+    
+    @staticmethod
+    def _result_key(*parts: Any) -> Optional[tuple]:
+        """Result cache key for parts, or None when a parameter is unhashable."""
+        try:
+            hash(parts)
+        except TypeError:
+            return None
+        return parts
+    
+    def _cached_result(self, key: Optional[tuple]) -> Optional[list]:
+        """Return a still-fresh cached result for key, or None."""
+        if key is None:
+            return None
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self.RESULT_CACHE_TTL:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return self._copy_rows(cached[1])
+    
+    def _remember_result(self, key: Optional[tuple], rows: Optional[list]) -> None:
+        """Cache a copy of the rows of a query under key."""
+        if key is None or rows is None:
+            return
+        self._result_cache[key] = (time.monotonic(), self._copy_rows(rows))
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    @staticmethod
+    def _copy_rows(rows: list) -> list:
+        """Copy rows so callers never share row dicts with the result cache."""
+        return [row.copy() if isinstance(row, dict) else row for row in rows]
+    
+    def invalidate_results(self, database: Optional[str] = None) -> None:
+        """Drop cached query results for one database, or for all of them."""
+        if database is None:
+            self._result_cache.clear()
+            return
+        for key in [k for k in self._result_cache if k[0] == database]:
+            del self._result_cache[key]
     
     async def _health_check_loop(self) -> None:
         """Background task to check connection health."""
@@ -324,11 +603,18 @@ class ConnectionManager:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Health check loop error: {e}")
+                logger.error("Health check loop error: %s", e)
     
     def get_all_statuses(self) -> Dict[str, ConnectionStatus]:
         """Get status of all connections."""
         return {
             name: conn.status 
             for name, conn in self.connections.items()
-        }
\ No newline at end of file
+        }
+    
+    def get_pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get pool statistics of all connections, for monitoring pool health."""
+        return {
+            name: conn.get_stats()
+            for name, conn in self.connections.items()
+        }
@@ -8,12 +8,26 @@ from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Any, Optional, IO, AsyncIterator
+from typing import List, Dict, Any, Optional, IO, AsyncIterator, Callable, Union
 import asyncio
 from io import StringIO
 
 logger = logging.getLogger(__name__)
 
+# Rows to export: an in-memory list, or batches streamed from a cursor
+ExportRows = Union[List[Dict[str, Any]], AsyncIterator[List[Dict[str, Any]]]]
+
+try:
+    import orjson
+    
+    def _dump_json_rows(rows: List[Dict[str, Any]], default: Callable[[Any], Any]) -> str:
+        return orjson.dumps(
+            rows, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _dump_json_rows(rows: List[Dict[str, Any]], default: Callable[[Any], Any]) -> str:
+        return json.dumps(rows, indent=2, ensure_ascii=False, default=default)
+
 
 class ExportFormat(Enum):
     """Supported export formats."""
@@ -64,9 +78,23 @@ class ExportOptions:
 class ExportManager:
     """Manages data export operations."""
     
+    WRITE_CHUNK_SIZE = 1000  # Rows handed to the CSV writer at once
+    
     def __init__(self):
         self.current_export = None
         self.export_cancelled = False
+        self.rows_exported = 0
+        self.bytes_written = 0  # Size of the last successful export's file
+    
+    @staticmethod
+    async def _batches(data: ExportRows) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate export rows batch by batch, whether listed or streamed."""
+        if isinstance(data, list):
+            if data:
+                yield data
+            return
+        async for batch in data:
+            yield batch
         
     def format_value(self, value: Any, options: ExportOptions) -> str:
         """Format a value for export based on its type."""
@@ -93,111 +121,152 @@ class ExportManager:
         else:
             return str(value)
     
+    def _sql_literal(self, value: Any) -> str:
+        """Render a value as a SQL literal for INSERT statements."""
+        if value is None:
+            return "NULL"
+        elif isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        elif isinstance(value, (int, float, Decimal)):
+            return str(value)
+        elif isinstance(value, (datetime, date)):
+            return f"'{value.isoformat()}'"
+        elif isinstance(value, bytes):
+            # Bytea data - use PostgreSQL hex format with \x for SQL compatibility
+            # Note: SQL INSERT statements require \x prefix for bytea literals
+            if len(value) == 0:
+                return "'\\x'::bytea"
+            else:
+                return f"'\\x{value.hex()}'::bytea"
+        elif isinstance(value, (dict, list)):
+            # JSON/JSONB
+            json_str = json.dumps(value).replace("'", "''")
+            return f"'{json_str}'::jsonb"
+        else:
+            # Escape single quotes in strings
+            escaped = str(value).replace("'", "''")
+            return f"'{escaped}'"
+    
     async def export_to_csv(
         self,
-        data: List[Dict[str, Any]],
+        data: ExportRows,
         filepath: str,
         options: ExportOptions,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        total_rows: Optional[int] = None
     ) -> bool:
         """Export data to CSV file.
         
         Args:
-            data: List of dictionaries containing the data
+            data: List of dictionaries, or an async iterator of batches of them
             filepath: Path to save the CSV file
             options: Export options
             progress_callback: Optional callback for progress updates
+            total_rows: Expected row count for progress when data is streamed,
+                or None when unknown (progress is then reported as None)
             
         Returns:
-            True if export successful, False otherwise
+            True if the export finished, False if it was cancelled. An empty
+            result also finishes, with rows_exported left at 0.
         """
         try:
             self.export_cancelled = False
-            total_rows = len(data)
+            self.rows_exported = 0
+            if isinstance(data, list):
+                total_rows = len(data)
             
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else ".", exist_ok=True)
             
             with open(filepath, 'w', newline='', encoding=options.encoding) as csvfile:
-                if not data:
-                    logger.warning("No data to export")
-                    return False
-                
-                # Get column names from first row
-                fieldnames = list(data[0].keys())
-                
-                # Configure CSV writer based on format
-                if options.format == ExportFormat.TSV:
-                    options.delimiter = '\t'
-                
-                writer = csv.DictWriter(
-                    csvfile,
-                    fieldnames=fieldnames,
-                    delimiter=options.delimiter,
-                    quotechar=options.quote_char,
-                    quoting=csv.QUOTE_MINIMAL,
-                    lineterminator=options.line_terminator
-                )
-                
-                # Write header if requested
-                if options.include_headers:
-                    writer.writeheader()
-                
-                # Write data rows
-                for i, row in enumerate(data):
-                    if self.export_cancelled:
-                        logger.info("Export cancelled by user")
-                        return False
+                writer = None
+                i = 0
+                format_value = self.format_value
+                async for batch in self._batches(data):
+                    if writer is None:
+                        # Get column names from first row
+                        fieldnames = list(batch[0].keys())
+                        
+                        # Configure CSV writer based on format
+                        if options.format == ExportFormat.TSV:
+                            options.delimiter = '\t'
+                        
+                        writer = csv.writer(
+                            csvfile,
+                            delimiter=options.delimiter,
+                            quotechar=options.quote_char,
+                            quoting=csv.QUOTE_MINIMAL,
+                            lineterminator=options.line_terminator
+                        )
+                        
+                        # Write header if requested
+                        if options.include_headers:
+                            writer.writerow(fieldnames)
                     
                     # Apply max_rows limit if set
-                    if options.max_rows and i >= options.max_rows:
-                        logger.info(f"Reached max_rows limit of {options.max_rows}")
-                        break
-                    
-                    # Format values in the row
-                    formatted_row = {
-                        key: self.format_value(value, options)
-                        for key, value in row.items()
-                    }
+                    if options.max_rows:
+                        if i >= options.max_rows:
+                            logger.info("Reached max_rows limit of %s", options.max_rows)
+                            break
+                        batch = batch[:options.max_rows - i]
                     
-                    writer.writerow(formatted_row)
-                    
-                    # Update progress
-                    if progress_callback and i % 100 == 0:
-                        progress = (i + 1) / total_rows * 100
-                        await progress_callback(progress, i + 1, total_rows)
-                    
-                    # Yield control periodically for large exports
-                    if i % 1000 == 0:
+                    # Write data rows a chunk at a time so the csv module drives the
+                    # loop, formatting and writing off the event loop thread
+                    for start in range(0, len(batch), self.WRITE_CHUNK_SIZE):
+                        if self.export_cancelled:
+                            logger.info("Export cancelled by user")
+                            return False
+                        
+                        chunk = batch[start:start + self.WRITE_CHUNK_SIZE]
+                        await asyncio.to_thread(writer.writerows, (
+                            [format_value(row.get(key), options) for key in fieldnames]
+                            for row in chunk
+                        ))
+                        i += len(chunk)
+                        
+                        # Update progress
+                        if progress_callback:
+                            progress = min(i / total_rows * 100, 100) if total_rows else None
+                            await progress_callback(progress, i, total_rows)
+                        
+                        # Yield control between chunks for large exports
                         await asyncio.sleep(0)
                 
+                if writer is None:
+                    logger.warning("No data to export")
+                    return True
+                self.rows_exported = i
+                self.bytes_written = csvfile.tell()
+                
                 # Final progress update
                 if progress_callback:
-                    await progress_callback(100, total_rows, total_rows)
+                    await progress_callback(100, i, i)
                 
-                logger.info(f"Successfully exported {min(len(data), options.max_rows or len(data))} rows to {filepath}")
+                logger.info("Successfully exported %s rows to %s", i, filepath)
                 return True
                 
         except PermissionError as e:
-            logger.error(f"Permission denied writing to {filepath}: {e}")
+            logger.error("Permission denied writing to %s: %s", filepath, e)
             raise
         except IOError as e:
-            logger.error(f"IO error writing to {filepath}: {e}")
+            logger.error("IO error writing to %s: %s", filepath, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during export: {e}", exc_info=True)
+            logger.error("Unexpected error during export: %s", e, exc_info=True)
             raise
     
     async def export_to_json(
         self,
-        data: List[Dict[str, Any]],
+        data: ExportRows,
         filepath: str,
         options: ExportOptions,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        total_rows: Optional[int] = None
     ) -> bool:
         """Export data to JSON file."""
         try:
             self.export_cancelled = False
+            self.rows_exported = 0
             
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else ".", exist_ok=True)
@@ -218,111 +287,124 @@ class ExportManager:
                     return None
                 return str(obj)
             
-            # Apply max_rows limit if set
-            export_data = data[:options.max_rows] if options.max_rows else data
-            
             with open(filepath, 'w', encoding=options.encoding) as jsonfile:
-                json.dump(
-                    export_data,
-                    jsonfile,
-                    indent=2,
-                    ensure_ascii=False,
-                    default=json_serializer
-                )
+                # Written a chunk at a time so streamed rows are never all held at
+                # once; the layout matches json.dump(rows, indent=2)
+                count = 0
+                async for batch in self._batches(data):
+                    if options.max_rows:
+                        batch = batch[:options.max_rows - count]
+                    for start in range(0, len(batch), self.WRITE_CHUNK_SIZE):
+                        if self.export_cancelled:
+                            logger.info("Export cancelled by user")
+                            return False
+                        
+                        # Encode off the event loop thread, then strip the list brackets
+                        chunk = batch[start:start + self.WRITE_CHUNK_SIZE]
+                        elements = (await asyncio.to_thread(
+                            _dump_json_rows, chunk, json_serializer
+                        ))[2:-2]
+                        jsonfile.write(("[\n" if count == 0 else ",\n") + elements)
+                        count += len(chunk)
+                        
+                        if progress_callback:
+                            progress = min(count / total_rows * 100, 100) if total_rows else None
+                            await progress_callback(progress, count, total_rows)
+                    
+                    if options.max_rows and count >= options.max_rows:
+                        break
+                
+                if not count:
+                    logger.warning("No data to export")
+                    return True
+                jsonfile.write("\n]")
+                self.bytes_written = jsonfile.tell()
             
-            logger.info(f"Successfully exported {len(export_data)} rows to {filepath}")
+            self.rows_exported = count
+            logger.info("Successfully exported %s rows to %s", count, filepath)
             return True
             
         except Exception as e:
-            logger.error(f"Error exporting to JSON: {e}", exc_info=True)
+            logger.error("Error exporting to JSON: %s", e, exc_info=True)
             raise
     
     async def export_to_sql(
         self,
-        data: List[Dict[str, Any]],
+        data: ExportRows,
         table_name: str,
         schema_name: str,
         filepath: str,
         options: ExportOptions,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        total_rows: Optional[int] = None
     ) -> bool:
         """Export data as SQL INSERT statements."""
         try:
             self.export_cancelled = False
-            total_rows = len(data)
+            self.rows_exported = 0
+            streamed = not isinstance(data, list)
+            if not streamed:
+                total_rows = len(data)
             
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else ".", exist_ok=True)
             
             with open(filepath, 'w', encoding=options.encoding) as sqlfile:
-                if not data:
-                    logger.warning("No data to export")
-                    return False
-                
-                # Get column names
-                columns = list(data[0].keys())
-                columns_str = ', '.join(f'"{col}"' for col in columns)
-                
-                # Write header comment
-                sqlfile.write(f"-- Export from {schema_name}.{table_name}\n")
-                sqlfile.write(f"-- Generated at {datetime.now().isoformat()}\n")
-                sqlfile.write(f"-- Total rows: {total_rows}\n\n")
-                
-                # Write INSERT statements
-                for i, row in enumerate(data):
-                    if self.export_cancelled:
-                        logger.info("Export cancelled by user")
-                        return False
-                    
-                    # Apply max_rows limit
-                    if options.max_rows and i >= options.max_rows:
-                        break
-                    
-                    # Format values
-                    values = []
-                    for col in columns:
-                        value = row[col]
-                        if value is None:
-                            values.append("NULL")
-                        elif isinstance(value, bool):
-                            values.append("TRUE" if value else "FALSE")
-                        elif isinstance(value, (int, float, Decimal)):
-                            values.append(str(value))
-                        elif isinstance(value, (datetime, date)):
-                            values.append(f"'{value.isoformat()}'")
-                        elif isinstance(value, bytes):
-                            # Bytea data - use PostgreSQL hex format with \x for SQL compatibility
-                            # Note: SQL INSERT statements require \x prefix for bytea literals
-                            if len(value) == 0:
-                                values.append("'\\x'::bytea")
-                            else:
-                                values.append(f"'\\x{value.hex()}'::bytea")
-                        elif isinstance(value, (dict, list)):
-                            # JSON/JSONB
-                            json_str = json.dumps(value).replace("'", "''")
-                            values.append(f"'{json_str}'::jsonb")
-                        else:
-                            # Escape single quotes in strings
-                            escaped = str(value).replace("'", "''")
-                            values.append(f"'{escaped}'")
-                    
-                    values_str = ', '.join(values)
-                    sqlfile.write(f'INSERT INTO "{schema_name}"."{table_name}" ({columns_str}) VALUES ({values_str});\n')
+                columns = None
+                i = 0
+                async for batch in self._batches(data):
+                    if columns is None:
+                        # Get column names
+                        columns = list(batch[0].keys())
+                        columns_str = ', '.join(f'"{col}"' for col in columns)
+                        
+                        # Write header comment; a streamed row count is only
+                        # known once the export finishes
+                        sqlfile.write(f"-- Export from {schema_name}.{table_name}\n")
+                        sqlfile.write(f"-- Generated at {datetime.now().isoformat()}\n")
+                        if not streamed:
+                            sqlfile.write(f"-- Total rows: {total_rows}\n")
+                        sqlfile.write("\n")
                     
-                    # Update progress
-                    if progress_callback and i % 100 == 0:
-                        progress = (i + 1) / total_rows * 100
-                        await progress_callback(progress, i + 1, total_rows)
-                    
-                    # Yield control periodically
-                    if i % 1000 == 0:
-                        await asyncio.sleep(0)
+                    # Write INSERT statements
+                    for row in batch:
+                        if self.export_cancelled:
+                            logger.info("Export cancelled by user")
+                            return False
+                        
+                        # Apply max_rows limit
+                        if options.max_rows and i >= options.max_rows:
+                            break
+                        
+                        values_str = ', '.join(self._sql_literal(row[col]) for col in columns)
+                        sqlfile.write(f'INSERT INTO "{schema_name}"."{table_name}" ({columns_str}) VALUES ({values_str});\n')
+                        
+                        # Update progress
+                        if progress_callback and i % 100 == 0:
+                            progress = min((i + 1) / total_rows * 100, 100) if total_rows else None
+                            await progress_callback(progress, i + 1, total_rows)
+                        
+                        # Yield control periodically
+                        if i % 1000 == 0:
+                            await asyncio.sleep(0)
+                        i += 1
+                    else:
+                        continue
+                    break
+                
+                if columns is None:
+                    logger.warning("No data to export")
+                    return True
+                if streamed:
+                    sqlfile.write(f"\n-- Total rows: {i}\n")
+                self.rows_exported = i
+                self.bytes_written = sqlfile.tell()
                 
-                logger.info(f"Successfully exported {min(len(data), options.max_rows or len(data))} rows to {filepath}")
+                logger.info("Successfully exported %s rows to %s", i, filepath)
                 return True
                 
         except Exception as e:
-            logger.error(f"Error exporting to SQL: {e}", exc_info=True)
+            logger.error("Error exporting to SQL: %s", e, exc_info=True)
             raise
     
     async def estimate_export_size(self, data: List[Dict[str, Any]], format: ExportFormat) -> int:
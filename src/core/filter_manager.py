@@ -69,6 +69,19 @@ class DataType(Enum):
     OTHER = "other"
 
 
+# Operators that compile to a plain "<col> <op> %s" comparison
+_COMPARISON_OPERATORS = {
+    FilterOperator.EQUALS: "=",
+    FilterOperator.NOT_EQUALS: "!=",
+    FilterOperator.GREATER_THAN: ">",
+    FilterOperator.LESS_THAN: "<",
+    FilterOperator.GREATER_EQUAL: ">=",
+    FilterOperator.LESS_EQUAL: "<=",
+    FilterOperator.BEFORE: "<",
+    FilterOperator.AFTER: ">",
+}
+
+
 @dataclass
 class ColumnFilter:
     """Represents a filter on a single column."""
@@ -86,7 +99,11 @@ class ColumnFilter:
         
         # Escape column name to prevent SQL injection
         col = f'"{self.column_name}"'
-        params = []
+        
+        # Plain comparisons are the common case; resolve them with one lookup
+        sql_op = _COMPARISON_OPERATORS.get(self.operator)
+        if sql_op:
+            return f"{col} {sql_op} %s", [self.value]
         
         # Handle NULL checks
         if self.operator == FilterOperator.IS_NULL:
@@ -101,12 +118,6 @@ class ColumnFilter:
             else:
                 return f"{col} ILIKE %s", [f"%{self.value}%"]
                 
-        elif self.operator == FilterOperator.EQUALS:
-            return f"{col} = %s", [self.value]
-            
-        elif self.operator == FilterOperator.NOT_EQUALS:
-            return f"{col} != %s", [self.value]
-            
         elif self.operator == FilterOperator.STARTS_WITH:
             if self.case_sensitive:
                 return f"{col} LIKE %s", [f"{self.value}%"]
@@ -144,19 +155,7 @@ class ColumnFilter:
             placeholders = ','.join(['%s'] * len(values))
             return f"{col} NOT IN ({placeholders})", values
         
-        # Numeric operators
-        elif self.operator == FilterOperator.GREATER_THAN:
-            return f"{col} > %s", [self.value]
-            
-        elif self.operator == FilterOperator.LESS_THAN:
-            return f"{col} < %s", [self.value]
-            
-        elif self.operator == FilterOperator.GREATER_EQUAL:
-            return f"{col} >= %s", [self.value]
-            
-        elif self.operator == FilterOperator.LESS_EQUAL:
-            return f"{col} <= %s", [self.value]
-            
+        # Range operators
         elif self.operator == FilterOperator.BETWEEN:
             # Expect value to be tuple/list of (min, max)
             if isinstance(self.value, str):
@@ -168,12 +167,6 @@ class ColumnFilter:
             raise ValueError(f"BETWEEN requires two values, got: {self.value}")
         
         # Date operators
-        elif self.operator == FilterOperator.BEFORE:
-            return f"{col} < %s", [self.value]
-            
-        elif self.operator == FilterOperator.AFTER:
-            return f"{col} > %s", [self.value]
-            
         elif self.operator == FilterOperator.DATE_BETWEEN:
             if isinstance(self.value, str):
                 parts = self.value.split(',')
@@ -214,12 +207,21 @@ class FilterState:
     saved_filters: List[Dict[str, Any]] = field(default_factory=list)
     filter_history: List[Dict[str, Any]] = field(default_factory=list)
     max_history: int = 100
+    # Bumped on every mutation; guards the cached WHERE clause
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _where_cache: Optional[Tuple[int, str, List[Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _summary_cache: Optional[Tuple[int, int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def add_filter(self, column: str, filter: ColumnFilter) -> None:
         """Add a filter for a column."""
         if column not in self.filters:
             self.filters[column] = []
         self.filters[column].append(filter)
+        self._version += 1
         self._add_to_history("add", column, filter)
     
     def remove_filter(self, column: str, index: int = None) -> None:
@@ -232,6 +234,7 @@ class FilterState:
                 removed = self.filters[column]
                 del self.filters[column]
                 self._add_to_history("remove_all", column, removed)
+            self._version += 1
             
             # Clean up empty lists
             if column in self.filters and not self.filters[column]:
@@ -242,11 +245,13 @@ class FilterState:
         if self.filters:
             self._add_to_history("clear_all", None, dict(self.filters))
         self.filters.clear()
+        self._version += 1
     
     def toggle_filter(self, column: str, index: int) -> None:
         """Toggle a filter's enabled state."""
         if column in self.filters and 0 <= index < len(self.filters[column]):
             self.filters[column][index].enabled = not self.filters[column][index].enabled
+            self._version += 1
             self._add_to_history("toggle", column, self.filters[column][index])
     
     def get_active_filters(self) -> List[ColumnFilter]:
@@ -264,8 +269,47 @@ class FilterState:
         """Check if any filters are active."""
         return self.get_filter_count() > 0
     
+    def summary(self, max_cols: int = 3) -> str:
+        """Describe the active filters for status messages, or "" if there are none.
+        
+        The text is cached until the filter state is next modified.
+        """
+        cache = self._summary_cache
+        if cache is None or cache[:2] != (self._version, max_cols):
+            cache = self._summary_cache = (self._version, max_cols, self._build_summary(max_cols))
+        return cache[2]
+    
+    def _build_summary(self, max_cols: int) -> str:
+        """Build the status-message description of the active filters."""
+        active = self.get_active_filters()
+        if not active:
+            return ""
+        
+        filter_count = len(active)
+        if filter_count == 1:
+            # Show the single filter
+            return f"filtered by {active[0].column_name} {active[0].operator.value}"
+        
+        # Show count and the first few columns that have an enabled filter
+        filtered_cols = list(dict.fromkeys(f.column_name for f in active))
+        cols_str = ", ".join(filtered_cols[:max_cols])
+        if len(filtered_cols) > max_cols:
+            cols_str += f", +{len(filtered_cols) - max_cols} more"
+        return f"{filter_count} filters on: {cols_str}"
+    
     def to_sql_where(self) -> Tuple[str, List[Any]]:
-        """Convert all active filters to SQL WHERE clause."""
+        """Convert all active filters to SQL WHERE clause.
+        
+        The result is cached until the filter state is next modified.
+        """
+        cache = self._where_cache
+        if cache is None or cache[0] != self._version:
+            where_clause, params = self._build_sql_where()
+            cache = self._where_cache = (self._version, where_clause, params)
+        return cache[1], list(cache[2])
+    
+    def _build_sql_where(self) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause for all active filters."""
         active_filters = self.get_active_filters()
         if not active_filters:
             return "", []
@@ -317,6 +361,7 @@ class FilterState:
             if saved["name"] == name:
                 self.filters = dict(saved["filters"])
                 self.logic = FilterLogic(saved["logic"])
+                self._version += 1
                 self._add_to_history("load_saved", name, saved)
                 return True
         return False
@@ -327,7 +372,6 @@ class FilterManager:
     
     def __init__(self):
         self.filter_states: Dict[str, FilterState] = {}  # Per-table filter states
-        self.column_types: Dict[str, Dict[str, DataType]] = {}  # Cache column types
         
     def get_state(self, table_key: str) -> FilterState:
         """Get or create filter state for a table."""
@@ -335,14 +379,12 @@ class FilterManager:
             self.filter_states[table_key] = FilterState()
         return self.filter_states[table_key]
     
-    async def detect_column_types(self, connection_manager, schema: str, table: str) -> Dict[str, DataType]:
-        """Detect column data types for a table."""
-        table_key = f"{schema}.{table}"
-        
-        # Check cache
-        if table_key in self.column_types:
-            return self.column_types[table_key]
+    async def detect_column_types(self, connection_manager, schema: str, table: str,
+                                  database: Optional[str] = None) -> Dict[str, DataType]:
+        """Detect column data types for a table.
         
+        Not cached here; DatabaseTab keeps the detected types per table.
+        """
         query = """
             SELECT column_name, data_type, udt_name
             FROM information_schema.columns
@@ -351,7 +393,7 @@ class FilterManager:
         """
         
         try:
-            results = await connection_manager.execute_query(query, (schema, table))
+            results = await connection_manager.execute_query(query, (schema, table), database=database)
             
             if results:
                 types = {}
@@ -397,14 +439,12 @@ class FilterManager:
                     else:
                         types[col_name] = DataType.OTHER
                 
-                # Cache the results
-                self.column_types[table_key] = types
                 return types
             else:
                 return {}
                 
         except Exception as e:
-            logger.error(f"Error detecting column types: {e}")
+            logger.error("Error detecting column types: %s", e)
             return {}
     
     def get_operators_for_type(self, data_type: DataType) -> List[FilterOperator]:
@@ -539,7 +579,7 @@ class FilterManager:
                 return results[0][count_col]
             return 0
         except Exception as e:
-            logger.error(f"Error getting filter preview count: {e}")
+            logger.error("Error getting filter preview count: %s", e)
             return -1
     
     def validate_filter_value(self, data_type: DataType, operator: FilterOperator, 
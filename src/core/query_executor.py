@@ -1,6 +1,7 @@
 """Query execution with safety features and command filtering."""
 
 import re
+import time
 import logging
 from dataclasses import dataclass
 from enum import Enum
@@ -11,6 +12,16 @@ import yaml
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)  # Only log warnings and errors
 
+# Statements allowed in read-only mode
+_READ_ONLY_RE = re.compile(
+    r'^(?:SELECT|WITH.*SELECT|SHOW|EXPLAIN|\\|BEGIN|COMMIT|ROLLBACK)', re.IGNORECASE
+)
+
+# Unsafe statement shapes recognised by SecurityGuard.suggest_safer_query
+_DELETE_ALL_RE = re.compile(r'^DELETE\s+FROM\s+(\w+)\s*$', re.IGNORECASE)
+_UPDATE_RE = re.compile(r'^UPDATE\s+(\w+)\s+SET\s+(.+?)(?:\s*$|;)', re.IGNORECASE)
+_DROP_RE = re.compile(r'^DROP\s+(TABLE|DATABASE|SCHEMA)\s+(\w+)', re.IGNORECASE)
+
 
 class QuerySeverity(Enum):
     """Severity levels for queries."""
@@ -88,10 +99,10 @@ class SecurityGuard:
                     )
                     self.whitelist_rules.append(rule)
                     
-            logger.info(f"Loaded {len(self.whitelist_rules)} whitelist rules")
+            logger.info("Loaded %s whitelist rules", len(self.whitelist_rules))
             
         except Exception as e:
-            logger.error(f"Failed to load whitelist: {e}")
+            logger.error("Failed to load whitelist: %s", e)
     
     def load_blacklist(self, path: str) -> None:
         """Load blacklist rules from YAML file."""
@@ -112,10 +123,10 @@ class SecurityGuard:
                     )
                     self.blacklist_rules.append(rule)
                     
-            logger.info(f"Loaded {len(self.blacklist_rules)} blacklist rules")
+            logger.info("Loaded %s blacklist rules", len(self.blacklist_rules))
             
         except Exception as e:
-            logger.error(f"Failed to load blacklist: {e}")
+            logger.error("Failed to load blacklist: %s", e)
     
     def check_query(self, query: str) -> Tuple[bool, Optional[SafetyRule], str]:
         """
@@ -128,11 +139,7 @@ class SecurityGuard:
         
         # In read-only mode, only allow SELECT and similar
         if self.read_only_mode:
-            read_only_patterns = [
-                r'^SELECT', r'^WITH.*SELECT', r'^SHOW', r'^EXPLAIN', r'^\\',
-                r'^BEGIN', r'^COMMIT', r'^ROLLBACK'
-            ]
-            if not any(re.match(p, query, re.IGNORECASE) for p in read_only_patterns):
+            if not _READ_ONLY_RE.match(query):
                 return (False, None, "Read-only mode: Only SELECT queries are allowed")
         
         # Check blacklist first (more restrictive)
@@ -163,20 +170,21 @@ class SecurityGuard:
         suggestions = []
         
         # DELETE without WHERE
-        if re.match(r'^DELETE\s+FROM\s+(\w+)\s*$', query, re.IGNORECASE):
-            table = re.match(r'^DELETE\s+FROM\s+(\w+)\s*$', query, re.IGNORECASE).group(1)
+        match = _DELETE_ALL_RE.match(query)
+        if match:
+            table = match.group(1)
             suggestions.append(f"DELETE FROM {table} WHERE <condition>")
         
         # UPDATE without WHERE
-        if re.match(r'^UPDATE\s+(\w+)\s+SET\s+(.+?)(?:\s*$|;)', query, re.IGNORECASE):
-            match = re.match(r'^UPDATE\s+(\w+)\s+SET\s+(.+?)(?:\s*$|;)', query, re.IGNORECASE)
+        match = _UPDATE_RE.match(query)
+        if match:
             if 'WHERE' not in query.upper():
                 table = match.group(1)
                 set_clause = match.group(2)
                 suggestions.append(f"UPDATE {table} SET {set_clause} WHERE <condition>")
         
         # DROP suggestions
-        if re.match(r'^DROP\s+(TABLE|DATABASE|SCHEMA)\s+(\w+)', query, re.IGNORECASE):
+        if _DROP_RE.match(query):
             suggestions.append("Consider using CASCADE or RESTRICT")
             suggestions.append("Make sure to backup before dropping")
         
@@ -210,14 +218,14 @@ class QueryExecutor:
             skip_safety: Skip safety checks (dangerous!)
             confirm_callback: Callback for confirmation prompts
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Safety check
         if not skip_safety:
             is_safe, rule, message = self.security_guard.check_query(query)
             
             if not is_safe:
-                logger.warning(f"Query blocked: {message}")
+                logger.warning("Query blocked: %s", message)
                 suggestion = self.security_guard.suggest_safer_query(query)
                 error_msg = f"{message}"
                 if suggestion:
@@ -286,7 +294,7 @@ class QueryExecutor:
                         if needs_transaction:
                             await db_conn.execute("COMMIT")
                         
-                        execution_time = (datetime.now() - start_time).total_seconds()
+                        execution_time = time.perf_counter() - start_time
                         
                         result = QueryResult(
                             success=True,
@@ -309,12 +317,12 @@ class QueryExecutor:
                     raise
                     
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
+            logger.error("Query execution failed: %s", e)
             return QueryResult(
                 success=False,
                 error=str(e),
                 query=query,
-                execution_time=(datetime.now() - start_time).total_seconds()
+                execution_time=time.perf_counter() - start_time
             )
     
     async def begin_transaction(self) -> QueryResult:
@@ -52,10 +52,10 @@ class UISettings:
                     # Merge with defaults (in case new settings were added)
                     settings = self.defaults.copy()
                     settings.update(loaded)
-                    logger.info(f"Loaded UI settings from {self.settings_file}")
+                    logger.info("Loaded UI settings from %s", self.settings_file)
                     return settings
             except Exception as e:
-                logger.error(f"Error loading settings: {e}")
+                logger.error("Error loading settings: %s", e)
                 return self.defaults.copy()
         else:
             logger.info("No existing settings file, using defaults")
@@ -70,10 +70,10 @@ class UISettings:
         try:
             with open(self.settings_file, 'w') as f:
                 json.dump(self.settings, f, indent=2)
-            logger.info(f"Saved UI settings to {self.settings_file}")
+            logger.info("Saved UI settings to %s", self.settings_file)
             return True
         except Exception as e:
-            logger.error(f"Error saving settings: {e}")
+            logger.error("Error saving settings: %s", e)
             return False
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -1,13 +1,22 @@
 """Working version of pgAdminTUI."""
 
 import asyncio
+import contextlib
+import functools
+import io
 import logging
 import os
+import re
 import sys
+import time
 import urllib.parse
 import yaml
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple
 from pathlib import Path
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Add parent directory to path for imports
 if __name__ == "__main__":
@@ -20,6 +29,7 @@ from textual.containers import Horizontal, Vertical, Container
 from src.ui.widgets.resizable_containers import ResizableHorizontal, ResizableVertical
 from textual.widgets import Header, Footer, TabbedContent, TabPane, Static, Label, Tree, DataTable, TextArea
 from textual.message import Message
+from rich.text import Text
 
 # Import our modules
 from src.core.connection_manager import ConnectionManager, DatabaseConfig, ConnectionStatus
@@ -51,23 +61,546 @@ logger = logging.getLogger(__name__)
 # Silence other noisy loggers
 logging.getLogger('asyncio').setLevel(logging.WARNING)
 logging.getLogger('textual').setLevel(logging.WARNING)
+logging.getLogger('psycopg').setLevel(logging.WARNING)
+
+
+class _StderrToLog(io.TextIOBase):
+    """Text stream that sends stray stderr output to the log file, line by line."""
+    
+    def __init__(self, log: logging.Logger):
+        super().__init__()
+        self._log = log
+        self._pending = ""
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, text: str) -> int:
+        *lines, self._pending = (self._pending + text).split("\n")
+        for line in lines:
+            if line.strip():
+                self._log.warning("%s", line)
+        return len(text)
+    
+    def flush(self) -> None:
+        if self._pending.strip():
+            self._log.warning("%s", self._pending)
+        self._pending = ""
+
+# Maximum number of rows rendered in the results table
+MAX_DISPLAY_ROWS = 1000
+ROW_CHUNK_SIZE = 200  # Rows added to the result table per event-loop turn
+
+# Query editor text: the initial contents and what selecting a table shows
+DEFAULT_QUERY = "-- Enter SQL query here\nSELECT * FROM pg_tables LIMIT 10;"
+BROWSE_QUERY_TEMPLATE = "SELECT * FROM {}.{} LIMIT 100;"
+
+# Column header indicators
+_SORT_INDICATORS = {"ASC": " ▲", "DESC": " ▼"}
+_FILTER_INDICATOR = " [F]"
+_HEADER_INDICATOR_RE = re.compile(r" ▲| ▼| \[F\]")
+
+# Cell rendering for the results table
+_NULL_CELL = "[dim]NULL[/dim]"
+_MAX_CELL_WIDTH = 100
+
+# ExportManager.export_to_<kind> per export format value, and whether it
+# takes the target table name
+_EXPORTERS = {
+    "csv": ("csv", False),
+    "tsv": ("csv", False),
+    "json": ("json", False),
+    "sql": ("sql", True),
+}
+
+# Units for export file sizes, each 1024 times the previous
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+try:
+    import orjson
+    
+    def _dump_json(val: Any) -> str:
+        return orjson.dumps(val, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    import json
+    
+    def _dump_json(val: Any) -> str:
+        return json.dumps(val, default=str, ensure_ascii=False)
+
+
+def _format_cell(val: Any) -> str:
+    """Render a single value for display in the results table."""
+    if val is None:
+        return _NULL_CELL
+    if type(val) is str:
+        return val[:_MAX_CELL_WIDTH]
+    if isinstance(val, (dict, list)):
+        # JSON/JSONB and array columns
+        return _dump_json(val)[:_MAX_CELL_WIDTH]
+    if isinstance(val, bytes):
+        # Format bytea columns - show full hex string with 0x prefix, no truncation
+        return f"0x{val.hex()}" if val else "0x (empty)"
+    return str(val)[:_MAX_CELL_WIDTH]
+
+
+# ${VAR} references in database configs
+_ENV_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Patterns used by DatabaseTab.parse_column_aliases
+_SELECT_RE = re.compile(r'SELECT\s+(.*?)\s+FROM', re.IGNORECASE | re.DOTALL)
+_COMMENT_RE = re.compile(r'--.*?(\n|$)')
+_ALIAS_RE = re.compile(r'(\w+(?:\.\w+)?)\s+AS\s+["\']?(\w+)["\']?', re.IGNORECASE)
+_LIST_TOKEN_RE = re.compile(r'[(),]')
+
+# Sort directions accepted as-is when building ORDER BY
+_SORT_DIRECTIONS = frozenset({"ASC", "DESC"})
+
+# Clause keywords located when splicing filters/sorting into a manual query
+_CLAUSE_RE = re.compile(r'\b(WHERE|GROUP\s+BY|ORDER\s+BY|LIMIT)\b', re.IGNORECASE)
+
+# A query's trailing LIMIT, checked and rewritten when exporting
+_LIMIT_RE = re.compile(r'\s+LIMIT\s+(\d+)\s*$', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _find_clauses(query: str) -> Dict[str, Tuple[int, ...]]:
+    """Locate WHERE/GROUP BY/ORDER BY/LIMIT keywords in a query.
+    
+    Returns the start offsets of each keyword keyed by its canonical
+    spelling, found in one case-insensitive scan instead of upper-casing
+    the whole query. Results are cached by query text, so a stored manual
+    query is only scanned once however often it is re-sorted or filtered;
+    treat the returned mapping as read-only.
+    """
+    positions = {}
+    for match in _CLAUSE_RE.finditer(query):
+        keyword = ' '.join(match.group(1).upper().split())
+        positions.setdefault(keyword, []).append(match.start())
+    return {keyword: tuple(offsets) for keyword, offsets in positions.items()}
+
+
+def _clause_pos(clauses: Dict[str, Tuple[int, ...]], keyword: str, last: bool = False, after: int = -1) -> int:
+    """Offset of the first (or last) keyword occurrence past `after`, or -1."""
+    offsets = [pos for pos in clauses.get(keyword, ()) if pos > after]
+    if not offsets:
+        return -1
+    return offsets[-1] if last else offsets[0]
+
+
+@functools.lru_cache(maxsize=32)
+def _alias_pattern(aliases: frozenset) -> re.Pattern:
+    """Compile a pattern matching any of the given aliases as a quoted identifier."""
+    alternation = '|'.join(re.escape(a) for a in aliases)
+    return re.compile(f'"({alternation})"')
+
+
+def _split_top_level(clause: str) -> List[str]:
+    """Split a select list on commas that are not inside parentheses."""
+    parts = []
+    depth = 0
+    start = 0
+    # Jump straight between parens and commas instead of walking every character
+    for match in _LIST_TOKEN_RE.finditer(clause):
+        char = match.group()
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif depth == 0:
+            parts.append(clause[start:match.start()].strip())
+            start = match.end()
+    tail = clause[start:].strip()
+    if tail:
+        parts.append(tail)
+    return parts
+
+
+def _split_terminator(query: str) -> Tuple[str, str]:
+    """Split a query into its trimmed body and trailing ';' (or '')."""
+    query = query.strip()
+    if query.endswith(';'):
+        return query[:-1].rstrip(), ';'
+    return query, ''
+
+
+@functools.lru_cache(maxsize=32)
+def _split_limit(query: str) -> Tuple[str, str, Optional[int]]:
+    """Split a manual query for export into (body, body without its LIMIT, LIMIT value).
+    
+    The body has its trailing semicolon removed; the LIMIT value is None when
+    the query does not end in one.
+    """
+    body, _ = _split_terminator(query)
+    match = _LIMIT_RE.search(body)
+    if not match:
+        return body, body, None
+    return body, body[:match.start()], int(match.group(1))
+
+
+def _trimmed_pos(query: str, pos: int) -> int:
+    """Offset where the whitespace run ending at pos starts."""
+    return len(query[:pos].rstrip())
+
+
+def _apply_edits(query: str, edits: List[Tuple[int, int, str]]) -> str:
+    """Apply (start, end, text) replacements, all given as offsets into `query`.
+    
+    The result is assembled in a single join instead of re-slicing the whole
+    query once per edit. Edits at the same offset keep their given order.
+    """
+    parts = []
+    prev = 0
+    for start, end, text in sorted(edits, key=lambda edit: edit[:2]):
+        parts.append(query[prev:start])
+        parts.append(text)
+        prev = max(prev, end)
+    parts.append(query[prev:])
+    return ''.join(parts)
+
+
+def _order_by_edit(query: str, clauses: Dict[str, Tuple[int, ...]],
+                   sort_column: Optional[str], direction: str) -> Optional[Tuple[int, int, str]]:
+    """Edit swapping a query's final ORDER BY for one on sort_column.
+    
+    With no sort_column the existing ORDER BY is just removed. `query` must
+    have had its trailing semicolon split off (see _split_terminator) and
+    `clauses` must hold its keyword offsets.
+    """
+    order_clause = f' {_order_by_sql(sort_column, direction)}' if sort_column else ''
+    
+    # Replace an existing ORDER BY up to the LIMIT that follows it, or the end
+    order_by_pos = _clause_pos(clauses, 'ORDER BY', last=True)
+    if order_by_pos > 0:
+        start = _trimmed_pos(query, order_by_pos)
+        limit_pos = _clause_pos(clauses, 'LIMIT', after=order_by_pos)
+        if limit_pos > 0:
+            return start, limit_pos, order_clause + ' '
+        return start, len(query), order_clause
+    
+    if not order_clause:
+        return None
+    
+    # Add new ORDER BY before LIMIT if present, otherwise at the end
+    limit_pos = _clause_pos(clauses, 'LIMIT', last=True)
+    if limit_pos > 0:
+        return _trimmed_pos(query, limit_pos), limit_pos, order_clause + ' '
+    return len(query), len(query), order_clause
+
+
+@functools.lru_cache(maxsize=32)
+def _sorted_manual_query(query: str, sort_column: Optional[str], direction: str) -> str:
+    """Return `query` re-ordered by sort_column, memoized for repeat sorts."""
+    edit = _order_by_edit(query, _find_clauses(query), sort_column, direction)
+    return _apply_edits(query, [edit]) if edit else query
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_column_aliases(query: str) -> Dict[str, str]:
+    """Map column aliases in a query's SELECT list to their real column names."""
+    aliases = {}
+    
+    # Match the SELECT clause, then look for column AS "Alias" or column AS Alias
+    select_match = _SELECT_RE.search(query)
+    
+    if select_match:
+        select_clause = select_match.group(1)
+        # Remove comments
+        select_clause = _COMMENT_RE.sub('', select_clause)
+        
+        # Split by commas (but not commas inside parentheses)
+        columns = _split_top_level(select_clause)
+        
+        # Parse each column for AS aliases
+        for col in columns:
+            # Pattern: column_name AS "Alias" or column_name AS Alias
+            alias_match = _ALIAS_RE.search(col)
+            if alias_match:
+                real_name = alias_match.group(1).split('.')[-1]  # Get column name without table prefix
+                alias_name = alias_match.group(2)
+                aliases[alias_name] = real_name
+    
+    if aliases and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found alias mappings: %s", aliases)
+    return aliases
+
+
+def _expand_env_vars(value: str, env: Dict[str, str]) -> str:
+    """Expand ${VAR} references in a string from an environment snapshot.
+    
+    Unknown variables are left untouched, and the values substituted in are
+    not expanded again.
+    """
+    get = env.get
+    return _ENV_RE.sub(lambda m: get(m.group(1), m.group(0)), value)
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a SQL identifier, doubling any embedded quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _order_by_sql(column: str, direction: str) -> str:
+    """ORDER BY clause for one column; unknown directions fall back to ASC."""
+    if direction not in _SORT_DIRECTIONS:
+        direction = "ASC"
+    return f"ORDER BY {_quote_ident(column)} {direction}"
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a SQL string literal, doubling any embedded single quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+@functools.lru_cache(maxsize=256)
+def _build_select(schema: str, table: str, where_clause: str = "",
+                  sort_column: Optional[str] = None, sort_direction: str = "ASC",
+                  limit: int = 100) -> str:
+    """Build the SELECT used to browse a table or view.
+    
+    The text is identical for identical arguments, so the driver can reuse a
+    server-side prepared statement across repeated navigation.
+    """
+    query = f"SELECT * FROM {_quote_ident(schema)}.{_quote_ident(table)}"
+    if where_clause:
+        query += f" WHERE {where_clause}"
+    if sort_column:
+        query += f" {_order_by_sql(sort_column, sort_direction)}"
+    return f"{query} LIMIT {limit}"
+
+
+# Static help content, built once at import
+HELP_TEXT = """
+Keyboard Shortcuts:
+- Ctrl+Q: Quit
+- Ctrl+Enter: Execute query
+- F3: Export data
+- F4: Filter current column
+- Ctrl+F: Quick filter (search)
+- Alt+F: Clear all filters
+- F5: Refresh tree
+- S: Sort by current column
+- Enter: Select table/view
+- Arrow keys: Navigate
+
+Table Features:
+- Click column headers to sort
+- Press 'S' on a column to sort
+- Press 'F4' on a column to filter
+- ▲ = ascending, ▼ = descending
+- [F] = filter active on column
+"""
+
+NO_DATABASE_TEXT = Text(
+    "No databases.yaml found and DATABASE_URL not set.\n\n"
+    "Please either:\n"
+    "1. Create a databases.yaml file with your database configurations\n"
+    "2. Set the DATABASE_URL environment variable"
+)
+
+
+# Explorer label prefix per tree node type
+_TREE_ICONS = {
+    "table": "📊 ",
+    "view": "👁 ",
+    "index": "🔑 ",
+    "function": "⚡ ",
+    "sequence": "🔢 ",
+    "matview": "📊 ",
+    "custom_type": "🏷 ",
+}
+
+SCHEMAS_QUERY = """
+    SELECT nspname 
+    FROM pg_catalog.pg_namespace 
+    WHERE nspname NOT IN ('pg_catalog', 'information_schema')
+          AND nspname !~ '^pg_'
+    ORDER BY nspname
+"""
+
+# Every object kind shown under a schema folder, fetched in one round trip.
+# Rows are (kind, name, extra) where extra holds an index's table or a
+# function's argument list. The loaders index rows by position, so keep
+# this select-list order.
+SCHEMA_OBJECTS_QUERY = """
+    WITH s AS (SELECT %s::name AS nsp)
+    SELECT 'tables' AS kind, tablename AS name, NULL::text AS extra
+    FROM s, pg_catalog.pg_tables
+    WHERE schemaname = s.nsp
+    UNION ALL
+    SELECT 'views', viewname, NULL
+    FROM s, pg_catalog.pg_views
+    WHERE schemaname = s.nsp
+    UNION ALL
+    SELECT 'indexes', indexname, tablename::text
+    FROM s, pg_catalog.pg_indexes
+    WHERE schemaname = s.nsp
+    UNION ALL
+    (SELECT 'functions', proname, pg_catalog.pg_get_function_arguments(p.oid)
+     FROM s, pg_catalog.pg_proc p
+     JOIN pg_catalog.pg_namespace n ON n.oid = p.pronamespace
+     WHERE n.nspname = s.nsp
+     ORDER BY proname
+     LIMIT 100)
+    UNION ALL
+    SELECT 'sequences', sequence_name::name, NULL
+    FROM s, information_schema.sequences
+    WHERE sequence_schema::name = s.nsp
+    UNION ALL
+    SELECT 'matviews', matviewname, NULL
+    FROM s, pg_catalog.pg_matviews
+    WHERE schemaname = s.nsp
+    UNION ALL
+    SELECT 'types', t.typname, NULL
+    FROM s, pg_catalog.pg_type t
+    JOIN pg_catalog.pg_namespace n ON t.typnamespace = n.oid
+    WHERE n.nspname = s.nsp
+    AND t.typtype IN ('c', 'e', 'd', 'r')  -- composite, enum, domain, range
+    AND NOT EXISTS (
+        SELECT 1 FROM pg_catalog.pg_class c WHERE c.oid = t.typrelid AND c.relkind = 'c'
+    )
+    ORDER BY kind, name
+"""
+
+
+# Application stylesheet, kept at module level so it is built once per process
+_PGADMIN_CSS = """
+    Screen {
+        background: $surface;
+    }
+    
+    .panel {
+        border: solid $primary;
+        margin: 0 1;
+        padding: 1;
+        height: 100%;
+    }
+    
+    .panel-title {
+        background: $primary;
+        color: $text;
+        padding: 0 1;
+        margin: 0 0 1 0;
+        text-style: bold;
+    }
+    
+    #explorer-panel {
+        /* Width now controlled by ResizableHorizontal */
+        height: 100%;
+    }
+    
+    #main-panel {
+        /* Width now controlled by ResizableHorizontal */
+        height: 100%;
+    }
+    
+    #query-container {
+        /* Height now controlled by ResizableVertical */
+        padding: 0;
+    }
+    
+    #results-container {
+        /* Height now controlled by ResizableVertical */
+        padding: 0;
+        padding-top: 1;   /* Space between splitter and Results title */
+        padding-bottom: 1;  /* Reserve space so horizontal scrollbar isn't clipped */
+    }
+    
+    #textarea-container {
+        height: 1fr;  /* Take remaining space */
+    }
+    
+    #tree-container {
+        height: 1fr;  /* Take remaining space */
+    }
+    
+    /* Splitter styling */
+    .h-splitter {
+        width: 1;
+        background: $primary;
+        height: 100%;
+    }
+    
+    .h-splitter:hover {
+        background: $warning;
+    }
+    
+    .v-splitter {
+        height: 1;
+        background: $primary;
+        width: 100%;
+    }
+    
+    .v-splitter:hover {
+        background: $warning;
+    }
+    
+    
+    /* Common scrollbar styling for all scrollable widgets */
+    Tree, TextArea {
+        height: 100%;
+        overflow-x: auto;
+        overflow-y: auto;
+        scrollbar-size: 2 1;  /* Vertical: 2, Horizontal: 1 - workaround for cutoff */
+        scrollbar-size-vertical: 2;
+        scrollbar-size-horizontal: 1;
+        scrollbar-gutter: stable;
+        scrollbar-background: $primary-darken-2;
+        scrollbar-background-hover: $primary-darken-1;
+        scrollbar-color: $primary;
+        scrollbar-color-hover: $primary-lighten-1;
+        scrollbar-color-active: $primary-lighten-2;
+        scrollbar-corner-color: $surface;
+    }
+    
+    DataTable {
+        height: 1fr;
+        width: 100%;
+        /* Use auto to show bars only when needed and avoid layout conflicts */
+        overflow-x: auto;
+        overflow-y: auto;
+        /* Give the horizontal bar an extra row to avoid terminal rounding/clipping */
+        scrollbar-size: 1 2;  /* Vertical: 1, Horizontal: 2 */
+        scrollbar-size-vertical: 1;
+        scrollbar-size-horizontal: 2;
+        scrollbar-gutter: stable;
+        scrollbar-background: $primary-darken-2;
+        scrollbar-background-hover: $primary-darken-1;
+        scrollbar-color: $primary;
+        scrollbar-color-hover: $primary-lighten-1;
+        scrollbar-color-active: $primary-lighten-2;
+        scrollbar-corner-color: $surface;
+    }
+"""
 
 
 class TableSelected(Message):
-    """Event when a table is selected in the explorer."""
-    def __init__(self, schema: str, table: str):
+    """Event when a table is selected in the explorer.
+    
+    tab is the DatabaseTab the table belongs to. rerun is set when the same
+    table is re-queried for a sort or filter change, which may then be
+    answered from the recent-results cache.
+    """
+    def __init__(self, schema: str, table: str, tab: Optional["DatabaseTab"] = None, rerun: bool = False):
         super().__init__()
         self.schema = schema
         self.table = table
+        self.tab = tab
+        self.rerun = rerun
 
 
 class DatabaseTab(TabPane):
     """A tab representing a database connection."""
     
+    CATALOG_TTL = 30.0  # Seconds to reuse catalog query results
+    RERUN_DELAY = 0.15  # Seconds to wait for further sort/filter changes before re-querying
+    
     def __init__(self, title: str, connection_name: str, connection_manager=None, ui_settings=None, **kwargs):
         super().__init__(title, **kwargs)
         self.connection_name = connection_name
         self.connection_manager = connection_manager
+        # The DatabaseConnection object is reused across reconnects, so look it up once
+        self.connection = connection_manager.connections.get(connection_name) if connection_manager else None
         self.ui_settings = ui_settings
         self.tree_widget = None
         self.query_input = None
@@ -76,11 +609,15 @@ class DatabaseTab(TabPane):
         self.current_table = None  # Store current table/view for sorting
         self.sort_column = None  # Track which column is sorted
         self.sort_direction = "ASC"  # Track sort direction (ASC/DESC)
-        self.column_map = {}  # Map ColumnKey objects to actual column names
+        self.column_names = []  # Real column names of data_table, by column index
+        self.catalog_cache = {}  # (connection, schema, kind) -> (fetched_at, rows)
+        self._catalog_tasks = {}  # In-flight catalog fetches by cache key
+        self._tree_loaded_at = None  # Monotonic time the tree was last built from the catalog
+        self._rerun_timer = None  # Pending debounced sort/filter re-execution
         self.filter_manager = FilterManager()  # Filter manager for this tab
         self.filter_state = None  # Current filter state
         self.filters_panel = None  # Active filters panel
-        self.column_types = {}  # Cache column types
+        self.column_types = {}  # Cache column types by (schema, table)
         self.filter_dialog = None  # Filter dialog widget
         self.manual_query = None  # Store manual query for re-execution with sorting/filtering
         self.manual_sort_column = None  # Sort column for manual queries
@@ -120,7 +657,7 @@ class DatabaseTab(TabPane):
                             yield Static("Query Input (Ctrl+Enter to execute):", classes="panel-title")
                             with Container(id="textarea-container"):
                                 self.query_input = TextArea(language="sql")
-                                self.query_input.text = "-- Enter SQL query here\nSELECT * FROM pg_tables LIMIT 10;"
+                                self.query_input.text = DEFAULT_QUERY
                                 yield self.query_input
                         
                         # Vertical splitter
@@ -141,38 +678,92 @@ class DatabaseTab(TabPane):
         """When the tab is mounted, refresh the tree if we have a connection."""
         if self.connection_manager:
             # Connect to this database if not already connected
-            conn = self.connection_manager.connections.get(self.connection_name)
-            logger.info(f"Tab {self.connection_name} mounted, status: {conn.status if conn else 'No connection'}")
+            conn = self.connection
+            logger.info("Tab %s mounted, status: %s", self.connection_name, conn.status if conn else 'No connection')
             
             if conn and conn.status != ConnectionStatus.CONNECTED:
                 self.app.notify(f"Connecting to {self.connection_name}...")
                 result = await self.connection_manager.connect_database(self.connection_name)
                 if result:
                     self.app.notify(f"✅ Connected to {self.connection_name}", severity="success")
-                    logger.info(f"Connected to {self.connection_name}")
+                    logger.info("Connected to %s", self.connection_name)
                 else:
                     self.app.notify(f"❌ Failed to connect to {self.connection_name}", severity="error")
-                    logger.error(f"Failed to connect to {self.connection_name}")
+                    logger.error("Failed to connect to %s", self.connection_name)
             elif conn and conn.status == ConnectionStatus.CONNECTED:
                 # Already connected
-                logger.info(f"Tab {self.connection_name} already connected")
+                logger.info("Tab %s already connected", self.connection_name)
             
             # Switch to this database and refresh tree
             self.connection_manager.switch_database(self.connection_name)
             await self.refresh_tree()
     
-    async def refresh_tree(self) -> None:
-        """Refresh the database tree."""
+    async def fetch_catalog(self, kind: str, query: str, schema: Optional[str] = None) -> Optional[List[tuple]]:
+        """Run a catalog query, reusing results fetched within CATALOG_TTL seconds."""
+        key = (self.connection_name, schema, kind)
+        cached = self.catalog_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.CATALOG_TTL:
+            return cached[1]
+        
+        # Share an in-flight fetch so a burst of expands issues a single query
+        task = self._catalog_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_catalog(key, query, schema))
+            self._catalog_tasks[key] = task
+            task.add_done_callback(lambda _: self._catalog_tasks.pop(key, None))
+        return await asyncio.shield(task)
+    
+    async def _load_catalog(self, key: tuple, query: str, schema: Optional[str]) -> Optional[List[tuple]]:
+        """Run a catalog query and store its result in the catalog cache."""
+        params = (schema,) if schema is not None else None
+        # Catalog SQL is constant, so have the server keep it prepared per connection.
+        # Rows come back as tuples; callers index them in select-list order.
+        results = await self.connection_manager.execute_query(
+            query, params, database=self.connection_name, prepare=True, as_tuples=True
+        )
+        if results is not None:
+            self.catalog_cache[key] = (time.monotonic(), results)
+        return results
+    
+    async def fetch_schema_objects(self, schema: str, kind: str) -> Optional[List[tuple]]:
+        """Return one kind of object in a schema as (kind, name, extra) rows.
+        
+        All object kinds for the schema come back from a single catalog query,
+        so expanding the other folders of the schema is served from the cache.
+        """
+        results = await self.fetch_catalog("objects", SCHEMA_OBJECTS_QUERY, schema)
+        if results is None:
+            return None
+        return [row for row in results if row[0] == kind]
+    
+    async def refresh_tree(self, clear_cache: bool = False) -> None:
+        """Refresh the database tree.
+        
+        A tree built within CATALOG_TTL seconds is left as it is, and catalog
+        results are reused while fresh, unless clear_cache is set.
+        """
         if not self.connection_manager or not self.tree_widget:
             return
         
-        logger.info(f"Refreshing tree for {self.connection_name}")
+        loaded_at = self._tree_loaded_at
+        if (not clear_cache and loaded_at is not None
+                and time.monotonic() - loaded_at < self.CATALOG_TTL):
+            return
+        
+        logger.info("Refreshing tree for %s", self.connection_name)
+        self._tree_loaded_at = None
+        
+        if clear_cache:
+            self.catalog_cache.clear()
+            if await self._refresh_loaded_folders():
+                self._tree_loaded_at = time.monotonic()
+                return
         
         # Clear existing tree
         self.tree_widget.clear()
         
-        # Get active connection
-        conn = self.connection_manager.get_active_connection()
+        # Get this tab's connection
+        conn = self.connection
         if not conn or conn.status != ConnectionStatus.CONNECTED:
             self.tree_widget.root.add("No connection")
             return
@@ -185,18 +776,11 @@ class DatabaseTab(TabPane):
         
         # Load schemas
         try:
-            query = """
-                SELECT nspname 
-                FROM pg_catalog.pg_namespace 
-                WHERE nspname NOT IN ('pg_catalog', 'information_schema')
-                      AND nspname !~ '^pg_'
-                ORDER BY nspname
-            """
-            
-            results = await self.connection_manager.execute_query(query)
+            results = await self.fetch_catalog("schemas", SCHEMAS_QUERY)
             if results:
+                eager_loads = []
                 for row in results:
-                    schema_name = row['nspname']
+                    schema_name = row[0]
                     schema_node = db_node.add(
                         f"📂 {schema_name}",
                         expand=(schema_name == 'public')
@@ -227,241 +811,224 @@ class DatabaseTab(TabPane):
                     
                     # Load tables for public schema immediately
                     if schema_name == 'public':
-                        await self.load_tables(tables_node, schema_name)
+                        eager_loads.append(self.load_tables(tables_node, schema_name))
+                
+                # Issue the eager folder loads concurrently; each uses its own pooled connection
+                if eager_loads:
+                    await asyncio.gather(*eager_loads, return_exceptions=True)
                 
-                logger.info(f"Loaded {len(results)} schemas")
+                self._tree_loaded_at = time.monotonic()
+                logger.info("Loaded %s schemas", len(results))
         except Exception as e:
-            logger.error(f"Error loading schemas: {e}")
+            logger.error("Error loading schemas: %s", e)
             self.app.notify(f"Error loading schemas: {e}", severity="error")
     
+    async def _refresh_loaded_folders(self) -> bool:
+        """Reload the folders already expanded in the tree, in place.
+        
+        Returns False when there is no tree yet or the schema list changed,
+        in which case the tree has to be rebuilt.
+        """
+        root_children = self.tree_widget.root.children
+        if len(root_children) != 1 or not root_children[0].children:
+            return False
+        schema_nodes = [node for node in root_children[0].children if node.data]
+        
+        try:
+            results = await self.fetch_catalog("schemas", SCHEMAS_QUERY)
+        except Exception as e:
+            logger.error("Error loading schemas: %s", e)
+            return False
+        if not results or [row[0] for row in results] != [node.data["name"] for node in schema_nodes]:
+            return False
+        
+        await asyncio.gather(*(
+            self.load_folder(folder)
+            for schema_node in schema_nodes
+            for folder in schema_node.children
+            if folder.children
+        ), return_exceptions=True)
+        return True
+    
+    def sync_folder(self, parent_node, entries: List[tuple]) -> None:
+        """Make a folder's children match (label, data) entries.
+        
+        Nodes for objects that still exist are kept and vanished ones removed,
+        so an unchanged folder is left untouched. New objects rebuild the
+        folder to keep it sorted.
+        """
+        existing = {
+            tuple(child.data.values()): child
+            for child in parent_node.children if child.data
+        }
+        wanted = {tuple(data.values()) for _, data in entries}
+        if existing and wanted and wanted <= existing.keys():
+            for key, child in existing.items():
+                if key not in wanted:
+                    child.remove()
+            return
+        
+        parent_node.remove_children()
+        for label, data in entries:
+            node = parent_node.add(label)
+            node.data = data
+        if not entries:
+            parent_node.add("(empty)")
+    
+    async def load_folder(self, node) -> None:
+        """Load the contents of a schema folder node."""
+        loader = {
+            "tables_folder": self.load_tables,
+            "views_folder": self.load_views,
+            "indexes_folder": self.load_indexes,
+            "functions_folder": self.load_functions,
+            "sequences_folder": self.load_sequences,
+            "matviews_folder": self.load_matviews,
+            "types_folder": self.load_types,
+        }.get(node.data.get("type"))
+        if loader:
+            await loader(node, node.data["schema"])
+    
     async def load_tables(self, parent_node, schema: str) -> None:
         """Load tables for a schema."""
         try:
-            query = """
-                SELECT tablename 
-                FROM pg_catalog.pg_tables 
-                WHERE schemaname = %s
-                ORDER BY tablename
-            """
-            
-            results = await self.connection_manager.execute_query(query, (schema,))
-            
-            # Clear placeholder
-            parent_node.remove_children()
+            results = await self.fetch_schema_objects(schema, "tables")
             
             if results:
-                for row in results:
-                    table_name = row['tablename']
-                    table_node = parent_node.add(f"📊 {table_name}")
-                    table_node.data = {
-                        "type": "table",
-                        "schema": schema,
-                        "name": table_name
-                    }
-                logger.info(f"Loaded {len(results)} tables for schema {schema}")
+                icon = _TREE_ICONS["table"]
+                entries = [
+                    (icon + row[1], {"type": "table", "schema": schema, "name": row[1]})
+                    for row in results
+                ]
+                self.sync_folder(parent_node, entries)
+                logger.info("Loaded %s tables for schema %s", len(results), schema)
             else:
-                parent_node.add("(empty)")
+                self.sync_folder(parent_node, [])
                 
         except Exception as e:
-            logger.error(f"Error loading tables: {e}")
+            logger.error("Error loading tables: %s", e)
     
     async def load_views(self, parent_node, schema: str) -> None:
         """Load views for a schema."""
         try:
-            query = """
-                SELECT viewname 
-                FROM pg_catalog.pg_views 
-                WHERE schemaname = %s
-                ORDER BY viewname
-            """
-            
-            results = await self.connection_manager.execute_query(query, (schema,))
-            
-            # Clear placeholder
-            parent_node.remove_children()
+            results = await self.fetch_schema_objects(schema, "views")
             
             if results:
-                for row in results:
-                    view_name = row['viewname']
-                    view_node = parent_node.add(f"👁 {view_name}")
-                    view_node.data = {
-                        "type": "view",
-                        "schema": schema,
-                        "name": view_name
-                    }
-                logger.info(f"Loaded {len(results)} views for schema {schema}")
+                icon = _TREE_ICONS["view"]
+                entries = [
+                    (icon + row[1], {"type": "view", "schema": schema, "name": row[1]})
+                    for row in results
+                ]
+                self.sync_folder(parent_node, entries)
+                logger.info("Loaded %s views for schema %s", len(results), schema)
             else:
-                parent_node.add("(empty)")
+                self.sync_folder(parent_node, [])
                 
         except Exception as e:
-            logger.error(f"Error loading views: {e}")
+            logger.error("Error loading views: %s", e)
     
     async def load_indexes(self, parent_node, schema: str) -> None:
         """Load indexes for a schema."""
         try:
-            query = """
-                SELECT indexname, tablename
-                FROM pg_indexes
-                WHERE schemaname = %s
-                ORDER BY indexname
-            """
-            
-            results = await self.connection_manager.execute_query(query, (schema,))
-            
-            # Clear placeholder
-            parent_node.remove_children()
+            results = await self.fetch_schema_objects(schema, "indexes")
             
             if results:
-                for row in results:
-                    index_name = row['indexname']
-                    table_name = row['tablename']
-                    index_node = parent_node.add(f"🔑 {index_name} ({table_name})")
-                    index_node.data = {
-                        "type": "index",
-                        "schema": schema,
-                        "name": index_name,
-                        "table": table_name
-                    }
-                logger.info(f"Loaded {len(results)} indexes for schema {schema}")
+                icon = _TREE_ICONS["index"]
+                entries = [
+                    (f"{icon}{row[1]} ({row[2]})",
+                     {"type": "index", "schema": schema, "name": row[1], "table": row[2]})
+                    for row in results
+                ]
+                self.sync_folder(parent_node, entries)
+                logger.info("Loaded %s indexes for schema %s", len(results), schema)
             else:
-                parent_node.add("(empty)")
+                self.sync_folder(parent_node, [])
                 
         except Exception as e:
-            logger.error(f"Error loading indexes: {e}")
+            logger.error("Error loading indexes: %s", e)
     
     async def load_functions(self, parent_node, schema: str) -> None:
         """Load functions for a schema."""
         try:
-            query = """
-                SELECT proname, pg_catalog.pg_get_function_arguments(p.oid) as args
-                FROM pg_catalog.pg_proc p
-                JOIN pg_catalog.pg_namespace n ON n.oid = p.pronamespace
-                WHERE n.nspname = %s
-                ORDER BY proname
-                LIMIT 100
-            """
-            
-            results = await self.connection_manager.execute_query(query, (schema,))
-            
-            # Clear placeholder
-            parent_node.remove_children()
+            results = await self.fetch_schema_objects(schema, "functions")
             
             if results:
+                icon = _TREE_ICONS["function"]
+                entries = []
                 for row in results:
-                    func_name = row['proname']
-                    args = row['args'] or ''
+                    func_name = row[1]
+                    args = row[2] or ''
                     display_name = f"{func_name}({args[:30]}{'...' if len(args) > 30 else ''})"
-                    func_node = parent_node.add(f"⚡ {display_name}")
-                    func_node.data = {
+                    entries.append((icon + display_name, {
                         "type": "function",
                         "schema": schema,
                         "name": func_name,
                         "args": args
-                    }
-                logger.info(f"Loaded {len(results)} functions for schema {schema}")
+                    }))
+                self.sync_folder(parent_node, entries)
+                logger.info("Loaded %s functions for schema %s", len(results), schema)
             else:
-                parent_node.add("(empty)")
+                self.sync_folder(parent_node, [])
                 
         except Exception as e:
-            logger.error(f"Error loading functions: {e}")
+            logger.error("Error loading functions: %s", e)
     
     async def load_sequences(self, parent_node, schema: str) -> None:
         """Load sequences for a schema."""
         try:
-            query = """
-                SELECT sequence_name
-                FROM information_schema.sequences
-                WHERE sequence_schema = %s
-                ORDER BY sequence_name
-            """
-            
-            results = await self.connection_manager.execute_query(query, (schema,))
-            
-            # Clear placeholder
-            parent_node.remove_children()
+            results = await self.fetch_schema_objects(schema, "sequences")
             
             if results:
-                for row in results:
-                    seq_name = row['sequence_name']
-                    seq_node = parent_node.add(f"🔢 {seq_name}")
-                    seq_node.data = {
-                        "type": "sequence",
-                        "schema": schema,
-                        "name": seq_name
-                    }
-                logger.info(f"Loaded {len(results)} sequences for schema {schema}")
+                icon = _TREE_ICONS["sequence"]
+                entries = [
+                    (icon + row[1], {"type": "sequence", "schema": schema, "name": row[1]})
+                    for row in results
+                ]
+                self.sync_folder(parent_node, entries)
+                logger.info("Loaded %s sequences for schema %s", len(results), schema)
             else:
-                parent_node.add("(empty)")
+                self.sync_folder(parent_node, [])
                 
         except Exception as e:
-            logger.error(f"Error loading sequences: {e}")
+            logger.error("Error loading sequences: %s", e)
     
     async def load_matviews(self, parent_node, schema: str) -> None:
         """Load materialized views for a schema."""
         try:
-            query = """
-                SELECT matviewname 
-                FROM pg_matviews 
-                WHERE schemaname = %s
-                ORDER BY matviewname
-            """
-            
-            results = await self.connection_manager.execute_query(query, (schema,))
-            
-            # Clear placeholder
-            parent_node.remove_children()
+            results = await self.fetch_schema_objects(schema, "matviews")
             
             if results:
-                for row in results:
-                    mv_name = row['matviewname']
-                    mv_node = parent_node.add(f"📊 {mv_name}")
-                    mv_node.data = {
-                        "type": "matview",
-                        "schema": schema,
-                        "name": mv_name
-                    }
-                logger.info(f"Loaded {len(results)} materialized views for schema {schema}")
+                icon = _TREE_ICONS["matview"]
+                entries = [
+                    (icon + row[1], {"type": "matview", "schema": schema, "name": row[1]})
+                    for row in results
+                ]
+                self.sync_folder(parent_node, entries)
+                logger.info("Loaded %s materialized views for schema %s", len(results), schema)
             else:
-                parent_node.add("(empty)")
+                self.sync_folder(parent_node, [])
                 
         except Exception as e:
-            logger.error(f"Error loading materialized views: {e}")
+            logger.error("Error loading materialized views: %s", e)
     
     async def load_types(self, parent_node, schema: str) -> None:
         """Load custom types for a schema."""
         try:
-            query = """
-                SELECT t.typname
-                FROM pg_type t
-                JOIN pg_namespace n ON t.typnamespace = n.oid
-                WHERE n.nspname = %s
-                AND t.typtype IN ('c', 'e', 'd', 'r')  -- composite, enum, domain, range
-                AND NOT EXISTS (
-                    SELECT 1 FROM pg_class c WHERE c.oid = t.typrelid AND c.relkind = 'c'
-                )
-                ORDER BY t.typname
-            """
-            
-            results = await self.connection_manager.execute_query(query, (schema,))
-            
-            # Clear placeholder
-            parent_node.remove_children()
+            results = await self.fetch_schema_objects(schema, "types")
             
             if results:
-                for row in results:
-                    type_name = row['typname']
-                    type_node = parent_node.add(f"🏷 {type_name}")
-                    type_node.data = {
-                        "type": "custom_type",
-                        "schema": schema,
-                        "name": type_name
-                    }
-                logger.info(f"Loaded {len(results)} types for schema {schema}")
+                icon = _TREE_ICONS["custom_type"]
+                entries = [
+                    (icon + row[1], {"type": "custom_type", "schema": schema, "name": row[1]})
+                    for row in results
+                ]
+                self.sync_folder(parent_node, entries)
+                logger.info("Loaded %s types for schema %s", len(results), schema)
             else:
-                parent_node.add("(empty)")
+                self.sync_folder(parent_node, [])
                 
         except Exception as e:
-            logger.error(f"Error loading types: {e}")
+            logger.error("Error loading types: %s", e)
     
     async def on_tree_node_expanded(self, event) -> None:
         """Handle node expansion for lazy loading."""
@@ -469,130 +1036,69 @@ class DatabaseTab(TabPane):
         if not node.data:
             return
         
-        node_type = node.data.get("type")
-        schema = node.data.get("schema")
-        
         # Only load if not already loaded (no children)
-        if schema and not node.children:
-            if node_type == "tables_folder":
-                await self.load_tables(node, schema)
-            elif node_type == "views_folder":
-                await self.load_views(node, schema)
-            elif node_type == "indexes_folder":
-                await self.load_indexes(node, schema)
-            elif node_type == "functions_folder":
-                await self.load_functions(node, schema)
-            elif node_type == "sequences_folder":
-                await self.load_sequences(node, schema)
-            elif node_type == "matviews_folder":
-                await self.load_matviews(node, schema)
-            elif node_type == "types_folder":
-                await self.load_types(node, schema)
+        if node.data.get("schema") and not node.children:
+            await self.load_folder(node)
+    
+    def reset_manual_state(self) -> None:
+        """Forget the manual query and its sort/filter/alias state."""
+        self.manual_query = None
+        self.manual_sort_column = None
+        self.manual_sort_direction = "ASC"
+        self.manual_filter_state = None
+        self.manual_column_aliases = {}
+    
+    def select_relation(self, schema: str, name: str, relation_type: str) -> None:
+        """Make a table, view or materialized view the current browse target."""
+        self.current_table = {"schema": schema, "name": name, "type": relation_type}
+        self.sort_column = None
+        self.sort_direction = "ASC"
+        self.reset_manual_state()
+        
+        # Initialize filter state for this relation
+        table_key = f"{schema}.{name}"
+        self.filter_state = self.filter_manager.get_state(table_key)
+        
+        # Update query input with simple query (no filters/sorting shown)
+        query = BROWSE_QUERY_TEMPLATE.format(schema, name)
+        if self.query_input:
+            self.query_input.text = query
+        
+        # Post message for main app to handle (which will apply filters/sorting internally)
+        self.post_message(TableSelected(schema, name, tab=self))
     
     async def on_tree_node_selected(self, event) -> None:
         """Handle node selection."""
-        node = event.node
-        if not node.data:
-            return
-        
-        node_type = node.data.get("type")
-        schema = node.data.get("schema")
-        name = node.data.get("name")
-        
-        if node_type == "table":
-            # Store current table info
-            self.current_table = {"schema": schema, "name": name, "type": "table"}
-            self.sort_column = None
-            self.sort_direction = "ASC"
-            
-            # Clear manual query info
-            self.manual_query = None
-            self.manual_sort_column = None
-            self.manual_sort_direction = "ASC"
-            self.manual_filter_state = None
-            self.manual_column_aliases = {}
-            
-            # Initialize filter state for this table
-            table_key = f"{schema}.{name}"
-            self.filter_state = self.filter_manager.get_state(table_key)
-            
-            # Update query input with simple query (no filters/sorting shown)
-            query = f"SELECT * FROM {schema}.{name} LIMIT 100;"
-            if self.query_input:
-                self.query_input.text = query
-            
-            # Post message for main app to handle (which will apply filters/sorting internally)
-            self.post_message(TableSelected(schema, name))
-            
-        elif node_type == "view":
-            # Store current view info
-            self.current_table = {"schema": schema, "name": name, "type": "view"}
-            self.sort_column = None
-            self.sort_direction = "ASC"
-            
-            # Clear manual query info
-            self.manual_query = None
-            self.manual_sort_column = None
-            self.manual_sort_direction = "ASC"
-            self.manual_filter_state = None
-            self.manual_column_aliases = {}
-            
-            # Initialize filter state for this view
-            table_key = f"{schema}.{name}"
-            self.filter_state = self.filter_manager.get_state(table_key)
-            
-            # Update query input for view
-            query = f"SELECT * FROM {schema}.{name} LIMIT 100;"
-            if self.query_input:
-                self.query_input.text = query
-            
-            # Post message (reuse TableSelected for views)
-            self.post_message(TableSelected(schema, name))
+        node = event.node
+        if not node.data:
+            return
+        
+        node_type = node.data.get("type")
+        schema = node.data.get("schema")
+        name = node.data.get("name")
+        
+        if node_type in ("table", "view", "matview"):
+            self.select_relation(schema, name, node_type)
             
         elif node_type == "index":
             # Show index definition
             table = node.data.get("table")
-            query = f"SELECT indexdef FROM pg_indexes WHERE schemaname = '{schema}' AND indexname = '{name}';"
+            query = f"SELECT indexdef FROM pg_indexes WHERE schemaname = {_quote_literal(schema)} AND indexname = {_quote_literal(name)};"
             if self.query_input:
                 self.query_input.text = query
                 
         elif node_type == "function":
             # Show function definition
-            query = f"SELECT pg_get_functiondef(p.oid) FROM pg_proc p JOIN pg_namespace n ON p.pronamespace = n.oid WHERE n.nspname = '{schema}' AND p.proname = '{name}' LIMIT 1;"
+            query = f"SELECT pg_get_functiondef(p.oid) FROM pg_proc p JOIN pg_namespace n ON p.pronamespace = n.oid WHERE n.nspname = {_quote_literal(schema)} AND p.proname = {_quote_literal(name)} LIMIT 1;"
             if self.query_input:
                 self.query_input.text = query
                 
         elif node_type == "sequence":
             # Show sequence info
-            query = f"SELECT * FROM {schema}.{name};"
+            query = f"SELECT * FROM {_quote_ident(schema)}.{_quote_ident(name)};"
             if self.query_input:
                 self.query_input.text = query
                 
-        elif node_type == "matview":
-            # Store current matview info
-            self.current_table = {"schema": schema, "name": name, "type": "matview"}
-            self.sort_column = None
-            self.sort_direction = "ASC"
-            
-            # Clear manual query info
-            self.manual_query = None
-            self.manual_sort_column = None
-            self.manual_sort_direction = "ASC"
-            self.manual_filter_state = None
-            self.manual_column_aliases = {}
-            
-            # Initialize filter state for this materialized view
-            table_key = f"{schema}.{name}"
-            self.filter_state = self.filter_manager.get_state(table_key)
-            
-            # Query materialized view
-            query = f"SELECT * FROM {schema}.{name} LIMIT 100;"
-            if self.query_input:
-                self.query_input.text = query
-            
-            # Post message (reuse TableSelected for matviews)
-            self.post_message(TableSelected(schema, name))
-            
         elif node_type == "custom_type":
             # Show type definition
             query = f"""
@@ -606,11 +1112,40 @@ class DatabaseTab(TabPane):
                        pg_catalog.format_type(t.oid, NULL) as definition
                 FROM pg_type t
                 JOIN pg_namespace n ON t.typnamespace = n.oid
-                WHERE n.nspname = '{schema}' AND t.typname = '{name}';
+                WHERE n.nspname = {_quote_literal(schema)} AND t.typname = {_quote_literal(name)};
             """
             if self.query_input:
                 self.query_input.text = query.strip()
     
+    def schedule_rerun(self, rerun: Callable[[], Awaitable[None]]) -> None:
+        """Run rerun after RERUN_DELAY seconds unless a newer rerun is scheduled.
+        
+        Rapid sort toggles and filter edits then cost one query instead of one
+        per keypress.
+        """
+        if self._rerun_timer is not None:
+            self._rerun_timer.stop()
+        self._rerun_timer = self.set_timer(self.RERUN_DELAY, functools.partial(self._run_rerun, rerun))
+    
+    def reexecute(self) -> None:
+        """Re-run the current manual or table query with its sort and filters, debounced."""
+        self.schedule_rerun(self.execute_sorted_manual_query if self.manual_query else self.execute_sorted_query)
+    
+    async def _run_rerun(self, rerun: Callable[[], Awaitable[None]]) -> None:
+        """Run a debounced rerun, reporting any failure to the user."""
+        self._rerun_timer = None
+        try:
+            await rerun()
+        except Exception as e:
+            logger.error("Re-running query failed: %s", e)
+            self.app.notify(f"Error re-running query: {e}", severity="error")
+    
+    def column_name_at(self, index: int) -> Optional[str]:
+        """Get the real column name for a data table column index."""
+        if 0 <= index < len(self.column_names):
+            return self.column_names[index]
+        return None
+    
     async def on_data_table_header_selected(self, event) -> None:
         """Handle column header clicks for sorting and filtering."""
         if not self.data_table:
@@ -621,17 +1156,11 @@ class DatabaseTab(TabPane):
             logger.info("Cannot sort - no query to re-execute")
             return
         
-        # Find which column was clicked - we stored columns with index as key
-        column_name = None
-        columns_list = list(self.data_table.columns.values())
-        for idx, col in enumerate(columns_list):
-            if col.key == event.column_key:
-                # Look up the actual column name using the index
-                column_name = self.column_map.get(str(idx))
-                break
+        # The event carries the clicked column's position, which indexes column_names directly
+        column_name = self.column_name_at(event.column_index)
         
         if not column_name:
-            logger.warning(f"Could not find column for key: {event.column_key}")
+            logger.warning("Could not find column for key: %s", event.column_key)
             return
         
         # Check if this is a manual query or table query
@@ -643,8 +1172,8 @@ class DatabaseTab(TabPane):
                 self.manual_sort_column = column_name
                 self.manual_sort_direction = "ASC"
             
-            logger.info(f"Manual query sort: {column_name} {self.manual_sort_direction}")
-            await self.execute_sorted_manual_query()
+            logger.info("Manual query sort: %s %s", column_name, self.manual_sort_direction)
+            self.reexecute()
         else:
             # Handle sorting for table query
             # Toggle sort direction if same column, otherwise reset
@@ -655,52 +1184,12 @@ class DatabaseTab(TabPane):
                 self.sort_direction = "ASC"
             
             # Re-execute query with ORDER BY
-            await self.execute_sorted_query()
+            self.reexecute()
     
     def parse_column_aliases(self, query: str) -> dict:
         """Parse a SQL query to extract column aliases mapping."""
-        import re
-        aliases = {}
-        
-        # Pattern to match column AS alias in SELECT clause
-        # Matches patterns like: column AS "Alias" or column AS Alias
-        select_pattern = r'SELECT\s+(.*?)\s+FROM'
-        select_match = re.search(select_pattern, query, re.IGNORECASE | re.DOTALL)
-        
-        if select_match:
-            select_clause = select_match.group(1)
-            # Remove comments
-            select_clause = re.sub(r'--.*?(\n|$)', '', select_clause)
-            
-            # Split by commas (but not commas inside parentheses)
-            columns = []
-            paren_depth = 0
-            current_col = ""
-            for char in select_clause:
-                if char == '(':
-                    paren_depth += 1
-                elif char == ')':
-                    paren_depth -= 1
-                elif char == ',' and paren_depth == 0:
-                    columns.append(current_col.strip())
-                    current_col = ""
-                    continue
-                current_col += char
-            if current_col.strip():
-                columns.append(current_col.strip())
-            
-            # Parse each column for AS aliases
-            for col in columns:
-                # Pattern: column_name AS "Alias" or column_name AS Alias
-                alias_pattern = r'(\w+(?:\.\w+)?)\s+AS\s+["\']?(\w+)["\']?'
-                alias_match = re.search(alias_pattern, col, re.IGNORECASE)
-                if alias_match:
-                    real_name = alias_match.group(1).split('.')[-1]  # Get column name without table prefix
-                    alias_name = alias_match.group(2)
-                    aliases[alias_name] = real_name
-                    logger.info(f"Found alias mapping: {alias_name} -> {real_name}")
-        
-        return aliases
+        # Copy so callers can't mutate the cached mapping
+        return dict(_parse_column_aliases(query))
     
     async def execute_filtered_manual_query(self) -> None:
         """Execute a manual query with filters and sorting applied."""
@@ -708,11 +1197,14 @@ class DatabaseTab(TabPane):
             logger.warning("No manual query to filter")
             return
         
-        logger.info(f"Filtering manual query with {self.manual_filter_state.get_filter_count() if self.manual_filter_state else 0} filters")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Filtering manual query with %s filters", self.manual_filter_state.get_filter_count() if self.manual_filter_state else 0)
+        
+        # Start with the base query, setting any trailing semicolon aside until the end
+        query, terminator = _split_terminator(self.manual_query)
+        clauses = _find_clauses(query)
         
-        # Start with the base query
-        query = self.manual_query.strip()
-        query_upper = query.upper()
+        edits = []
         
         # Apply filters if any
         filter_params = []
@@ -721,22 +1213,23 @@ class DatabaseTab(TabPane):
             # We need to replace alias names with real column names in the WHERE clause
             where_clause, params = self.manual_filter_state.to_sql_where()
             
-            # Replace aliases with real column names in WHERE clause
+            # Replace "Alias" with "real_name" in WHERE clause in a single pass
             if where_clause and self.manual_column_aliases:
-                for alias, real_name in self.manual_column_aliases.items():
-                    # Replace "Alias" with "real_name" in WHERE clause
-                    where_clause = where_clause.replace(f'"{alias}"', f'"{real_name}"')
-                    logger.info(f"Replaced alias {alias} with {real_name} in WHERE clause")
+                aliases = self.manual_column_aliases
+                where_clause = _alias_pattern(frozenset(aliases)).sub(
+                    lambda m: f'"{aliases[m.group(1)]}"', where_clause
+                )
+                logger.info("Replaced %s aliases in WHERE clause", len(aliases))
             
             if where_clause:
                 filter_params = params
                 
                 # Find where to insert WHERE clause
                 # Need to handle cases with existing WHERE, GROUP BY, ORDER BY, LIMIT
-                where_pos = query_upper.find('WHERE')
-                group_pos = query_upper.find('GROUP BY')
-                order_pos = query_upper.find('ORDER BY')
-                limit_pos = query_upper.find('LIMIT')
+                where_pos = _clause_pos(clauses, 'WHERE')
+                group_pos = _clause_pos(clauses, 'GROUP BY')
+                order_pos = _clause_pos(clauses, 'ORDER BY')
+                limit_pos = _clause_pos(clauses, 'LIMIT')
                 
                 # Find the insertion point (after FROM but before GROUP BY/ORDER BY/LIMIT)
                 if where_pos > 0:
@@ -748,7 +1241,7 @@ class DatabaseTab(TabPane):
                             end_pos = pos
                     
                     # Insert before GROUP BY/ORDER BY/LIMIT
-                    query = query[:end_pos].rstrip() + f" AND ({where_clause}) " + query[end_pos:]
+                    edits.append((_trimmed_pos(query, end_pos), end_pos, f" AND ({where_clause}) "))
                 else:
                     # No WHERE clause - add one
                     # Find where to insert (before GROUP BY/ORDER BY/LIMIT)
@@ -757,14 +1250,10 @@ class DatabaseTab(TabPane):
                         if pos > 0 and pos < insert_pos:
                             insert_pos = pos
                     
-                    # Handle semicolon at end
-                    if insert_pos == len(query) and query.rstrip().endswith(';'):
-                        query = query.rstrip()[:-1] + f" WHERE {where_clause};"
+                    if insert_pos == len(query):
+                        edits.append((insert_pos, insert_pos, f" WHERE {where_clause}"))
                     else:
-                        query = query[:insert_pos].rstrip() + f" WHERE {where_clause} " + query[insert_pos:]
-                
-                # Update query_upper after modification
-                query_upper = query.upper()
+                        edits.append((_trimmed_pos(query, insert_pos), insert_pos, f" WHERE {where_clause} "))
         
         # Apply sorting if any
         if self.manual_sort_column:
@@ -772,39 +1261,23 @@ class DatabaseTab(TabPane):
             sort_column = self.manual_sort_column
             if sort_column in self.manual_column_aliases:
                 sort_column = self.manual_column_aliases[sort_column]
-                logger.info(f"Using real column name {sort_column} instead of alias {self.manual_sort_column} for sorting")
+                logger.info("Using real column name %s instead of alias %s for sorting", sort_column, self.manual_sort_column)
             
-            # Remove existing ORDER BY if present
-            order_by_pos = query_upper.rfind('ORDER BY')
-            if order_by_pos > 0:
-                # Find where ORDER BY clause ends (before LIMIT or end of query)
-                limit_pos = query_upper.find('LIMIT', order_by_pos)
-                if limit_pos > 0:
-                    query = query[:order_by_pos].rstrip() + ' ' + query[limit_pos:]
-                else:
-                    query = query[:order_by_pos].rstrip()
-                # Update query_upper after modification
-                query_upper = query.upper()
-            
-            # Add new ORDER BY before LIMIT if present, otherwise at the end
-            limit_pos = query_upper.rfind('LIMIT')
-            order_clause = f'ORDER BY "{sort_column}" {self.manual_sort_direction}'
-            if limit_pos > 0:
-                query = query[:limit_pos].rstrip() + f' {order_clause} ' + query[limit_pos:]
-            else:
-                # Remove trailing semicolon if present
-                if query.rstrip().endswith(';'):
-                    query = query.rstrip()[:-1] + f' {order_clause};'
-                else:
-                    query = query + f' {order_clause}'
+            edit = _order_by_edit(query, clauses, sort_column, self.manual_sort_direction)
+            if edit:
+                edits.append(edit)
         
-        logger.info(f"Modified query: {query[:200]}")
-        logger.info(f"Filter params: {filter_params}")
+        # All edits are offsets into the original query, so build it once
+        query = _apply_edits(query, edits)
+        query += terminator
+        
+        logger.info("Modified query: %s", query[:200])
+        logger.info("Filter params: %s", filter_params)
         
         # Execute the filtered/sorted query
         app = self.app
         if app:
-            await app.execute_query_with_params(query, filter_params, is_manual=True, preserve_sort=True)
+            await app.execute_query_with_params(query, filter_params, is_manual=True, preserve_sort=True, pane=self)
     
     async def execute_sorted_manual_query(self) -> None:
         """Execute a manual query with sorting applied (and filters if any)."""
@@ -819,51 +1292,26 @@ class DatabaseTab(TabPane):
         
         # No filters, just apply sorting if any
         if self.manual_sort_column:
-            logger.info(f"Sorting manual query by {self.manual_sort_column} {self.manual_sort_direction}")
+            logger.info("Sorting manual query by %s %s", self.manual_sort_column, self.manual_sort_direction)
         else:
             logger.info("Executing manual query without sorting or filtering")
         
-        # Parse the query to add ORDER BY
-        query = self.manual_query.strip()
-        query_upper = query.upper()
-        
         # Check if sort column is an alias and get real name
         sort_column = self.manual_sort_column
         if sort_column in self.manual_column_aliases:
             sort_column = self.manual_column_aliases[sort_column]
-            logger.info(f"Using real column name {sort_column} instead of alias {self.manual_sort_column} for sorting")
-        
-        # Remove existing ORDER BY if present
-        order_by_pos = query_upper.rfind('ORDER BY')
-        if order_by_pos > 0:
-            # Find where ORDER BY clause ends (before LIMIT or end of query)
-            limit_pos = query_upper.find('LIMIT', order_by_pos)
-            if limit_pos > 0:
-                query = query[:order_by_pos].rstrip() + ' ' + query[limit_pos:]
-            else:
-                query = query[:order_by_pos].rstrip()
-            # Update query_upper after modification
-            query_upper = query.upper()
+            logger.info("Using real column name %s instead of alias %s for sorting", sort_column, self.manual_sort_column)
         
-        # Add new ORDER BY before LIMIT if present, otherwise at the end
-        limit_pos = query_upper.rfind('LIMIT')
-        if self.manual_sort_column:
-            order_clause = f'ORDER BY "{sort_column}" {self.manual_sort_direction}'
-            if limit_pos > 0:
-                query = query[:limit_pos].rstrip() + f' {order_clause} ' + query[limit_pos:]
-            else:
-                # Remove trailing semicolon if present
-                if query.rstrip().endswith(';'):
-                    query = query.rstrip()[:-1] + f' {order_clause};'
-                else:
-                    query = query + f' {order_clause}'
+        # Rebuilt only when the query, column or direction differ from a recent call
+        query, terminator = _split_terminator(self.manual_query)
+        query = _sorted_manual_query(query, sort_column, self.manual_sort_direction) + terminator
         
-        logger.info(f"Modified query: {query[:200]}")
+        logger.info("Modified query: %s", query[:200])
         
         # Execute the sorted query - mark as manual and preserve sort state
         app = self.app
         if app:
-            await app.execute_query(query, is_manual=True, preserve_sort=True)
+            await app.execute_query(query, is_manual=True, preserve_sort=True, pane=self)
     
     async def execute_sorted_query(self) -> None:
         """Execute the current table query with sorting and filtering."""
@@ -874,156 +1322,29 @@ class DatabaseTab(TabPane):
         schema = self.current_table["schema"]
         name = self.current_table["name"]
         
-        logger.info(f"execute_sorted_query called for {schema}.{name}")
-        
-        # Build base query
-        base_query = f"SELECT * FROM {schema}.{name}"
-        
-        # Apply filters if any
-        if self.filter_state and self.filter_state.has_filters():
-            where_clause, params = self.filter_state.to_sql_where()
-            logger.info(f"Filter WHERE clause: {where_clause}")
-            logger.info(f"Filter params: {params}")
-            if where_clause:
-                base_query += f" WHERE {where_clause}"
-        else:
-            logger.info("No filters active")
-        
-        # Add ORDER BY if sorting
-        if self.sort_column:
-            base_query += f' ORDER BY "{self.sort_column}" {self.sort_direction}'
+        logger.info("execute_sorted_query called for %s.%s", schema, name)
         
-        # Add LIMIT
-        base_query += " LIMIT 100"
-        
-        logger.info(f"Final query: {base_query}")
+        # on_table_selected builds the SELECT with this tab's sort and filters
         
         # DON'T update the query input - keep it simple so users can edit it
         # Only update if query input shows the basic query for this table
         if self.query_input:
             current_text = self.query_input.text.strip()
-            basic_query = f"SELECT * FROM {schema}.{name} LIMIT 100;"
+            basic_query = BROWSE_QUERY_TEMPLATE.format(schema, name)
             # Only update if it's showing the basic query (not a user-modified one)
             if current_text == basic_query or current_text == basic_query.rstrip(';'):
                 # Keep showing the simple query, don't add WHERE/ORDER BY to the text box
                 pass  # Don't change the query input
-            logger.info(f"Query input NOT updated to avoid confusing manual queries")
+            logger.info("Query input NOT updated to avoid confusing manual queries")
         
         # Execute via the main app
-        self.post_message(TableSelected(schema, name))
+        self.post_message(TableSelected(schema, name, tab=self, rerun=True))
 
 
 class PgAdminTUI(App):
     """Main TUI application for PostgreSQL administration."""
     
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-    
-    .panel {
-        border: solid $primary;
-        margin: 0 1;
-        padding: 1;
-        height: 100%;
-    }
-    
-    .panel-title {
-        background: $primary;
-        color: $text;
-        padding: 0 1;
-        margin: 0 0 1 0;
-        text-style: bold;
-    }
-    
-    #explorer-panel {
-        /* Width now controlled by ResizableHorizontal */
-        height: 100%;
-    }
-    
-    #main-panel {
-        /* Width now controlled by ResizableHorizontal */
-        height: 100%;
-    }
-    
-    #query-container {
-        /* Height now controlled by ResizableVertical */
-        padding: 0;
-    }
-    
-    #results-container {
-        /* Height now controlled by ResizableVertical */
-        padding: 0;
-        padding-top: 1;   /* Space between splitter and Results title */
-        padding-bottom: 1;  /* Reserve space so horizontal scrollbar isn't clipped */
-    }
-    
-    #textarea-container {
-        height: 1fr;  /* Take remaining space */
-    }
-    
-    #tree-container {
-        height: 1fr;  /* Take remaining space */
-    }
-    
-    /* Splitter styling */
-    .h-splitter {
-        width: 1;
-        background: $primary;
-        height: 100%;
-    }
-    
-    .h-splitter:hover {
-        background: $warning;
-    }
-    
-    .v-splitter {
-        height: 1;
-        background: $primary;
-        width: 100%;
-    }
-    
-    .v-splitter:hover {
-        background: $warning;
-    }
-    
-    
-    /* Common scrollbar styling for all scrollable widgets */
-    Tree, TextArea {
-        height: 100%;
-        overflow-x: auto;
-        overflow-y: auto;
-        scrollbar-size: 2 1;  /* Vertical: 2, Horizontal: 1 - workaround for cutoff */
-        scrollbar-size-vertical: 2;
-        scrollbar-size-horizontal: 1;
-        scrollbar-gutter: stable;
-        scrollbar-background: $primary-darken-2;
-        scrollbar-background-hover: $primary-darken-1;
-        scrollbar-color: $primary;
-        scrollbar-color-hover: $primary-lighten-1;
-        scrollbar-color-active: $primary-lighten-2;
-        scrollbar-corner-color: $surface;
-    }
-    
-    DataTable {
-        height: 1fr;
-        width: 100%;
-        /* Use auto to show bars only when needed and avoid layout conflicts */
-        overflow-x: auto;
-        overflow-y: auto;
-        /* Give the horizontal bar an extra row to avoid terminal rounding/clipping */
-        scrollbar-size: 1 2;  /* Vertical: 1, Horizontal: 2 */
-        scrollbar-size-vertical: 1;
-        scrollbar-size-horizontal: 2;
-        scrollbar-gutter: stable;
-        scrollbar-background: $primary-darken-2;
-        scrollbar-background-hover: $primary-darken-1;
-        scrollbar-color: $primary;
-        scrollbar-color-hover: $primary-lighten-1;
-        scrollbar-color-active: $primary-lighten-2;
-        scrollbar-corner-color: $surface;
-    }
-    """
+    CSS = _PGADMIN_CSS
     
     BINDINGS = [
         Binding("ctrl+q", "quit", "Quit"),
@@ -1044,6 +1365,7 @@ class PgAdminTUI(App):
         self.tabbed_content = None
         self.database_configs = []
         self.config_path = config_path  # Store the config path for use in on_mount
+        self._yaml_cache = None  # ((path, mtime), databases) of the last parsed config
         
     def compose(self) -> ComposeResult:
         """Compose the main application layout."""
@@ -1060,7 +1382,7 @@ class PgAdminTUI(App):
         if config_path:
             config_file = Path(config_path)
             if not config_file.exists():
-                logger.error(f"Config file not found: {config_path}")
+                logger.error("Config file not found: %s", config_path)
                 self.notify(f"Config file not found: {config_path}", severity="error")
                 return []
         else:
@@ -1077,24 +1399,31 @@ class PgAdminTUI(App):
                 config_file = Path.home() / '.pgadmintui' / "databases.yaml"
             
             if not config_file.exists():
-                logger.info(f"No databases.yaml found in any of the standard locations")
+                logger.info("No databases.yaml found in any of the standard locations")
                 return []
         
         try:
-            logger.info(f"Loading database configurations from {config_file}")
+            # Reuse the last parse while the file is unchanged; callers expand
+            # env vars in place, so hand out copies of the cached entries
+            cache_key = (config_file, config_file.stat().st_mtime)
+            if self._yaml_cache and self._yaml_cache[0] == cache_key:
+                return [dict(db) for db in self._yaml_cache[1]]
+            
+            logger.info("Loading database configurations from %s", config_file)
             with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=YamlLoader)
                 
-            if config_data and 'databases' in config_data:
-                databases = config_data['databases']
-                logger.info(f"Loaded {len(databases)} database configurations from {config_file}")
-                return databases
+            databases = (config_data or {}).get('databases')
+            if databases:
+                logger.info("Loaded %s database configurations from %s", len(databases), config_file)
+                self._yaml_cache = (cache_key, databases)
+                return [dict(db) for db in databases]
             else:
-                logger.warning(f"No 'databases' section found in {config_file}")
+                logger.warning("No 'databases' section found in %s", config_file)
                 return []
                 
         except Exception as e:
-            logger.error(f"Error loading databases.yaml: {e}")
+            logger.error("Error loading databases.yaml: %s", e)
             self.notify(f"Error loading databases.yaml: {e}", severity="error")
             return []
     
@@ -1113,51 +1442,72 @@ class PgAdminTUI(App):
             config_file_name = Path(self.config_path).name if self.config_path else "databases.yaml"
             self.notify(f"Loading {len(self.database_configs)} databases from {config_file_name}...")
             
+            # Snapshot the environment once for variable expansion
+            env = dict(os.environ)
+            
             # Add all databases to connection manager
             for db_config in self.database_configs:
                 try:
                     # Replace environment variables in the config
-                    for key in ['username', 'password']:
-                        if key in db_config and db_config[key].startswith('${') and db_config[key].endswith('}'):
-                            env_var = db_config[key][2:-1]
-                            db_config[key] = os.environ.get(env_var, db_config[key])
+                    for key, value in db_config.items():
+                        if isinstance(value, str):
+                            db_config[key] = _expand_env_vars(value, env)
                     
-                    config = DatabaseConfig(**db_config)
+                    config = DatabaseConfig.from_dict(db_config)
                     self.connection_manager.add_database(config)
-                    logger.info(f"Added database config: {db_config['name']}")
+                    logger.info("Added database config: %s", db_config['name'])
                 except Exception as e:
-                    logger.error(f"Error adding database {db_config.get('name', 'unknown')}: {e}")
+                    logger.error("Error adding database %s: %s", db_config.get('name', 'unknown'), e)
                     self.notify(f"Error adding database {db_config.get('name', 'unknown')}: {e}", severity="error")
             
-            # Create tabs for each database (without connecting yet)
-            for db_config in self.database_configs:
-                try:
-                    db_name = db_config['name']
-                    tab = DatabaseTab(
-                        db_name, 
-                        db_name,
-                        connection_manager=self.connection_manager,
-                        ui_settings=self.ui_settings
-                    )
-                    self.tabbed_content.add_pane(tab)
-                    logger.info(f"Created tab for database: {db_name}")
-                except Exception as e:
-                    logger.error(f"Error creating tab for {db_config.get('name', 'unknown')}: {e}")
+            # Create tabs for each database, coalescing the refreshes into one
+            with self.batch_update():
+                for db_config in self.database_configs:
+                    try:
+                        db_name = db_config['name']
+                        tab = DatabaseTab(
+                            db_name, 
+                            db_name,
+                            connection_manager=self.connection_manager,
+                            ui_settings=self.ui_settings
+                        )
+                        self.tabbed_content.add_pane(tab)
+                        logger.info("Created tab for database: %s", db_name)
+                    except Exception as e:
+                        logger.error("Error creating tab for %s: %s", db_config.get('name', 'unknown'), e)
+            
+            # Connect to all databases concurrently so handshakes overlap
+            names = list(self.connection_manager.connections)
+            results = await asyncio.gather(
+                *(self.connection_manager.connect_database(name) for name in names),
+                return_exceptions=True
+            )
+            # Report the outcome in one notification rather than one per database
+            failed = []
+            for name, result in zip(names, results):
+                if result is True:
+                    logger.info("Connected to %s", name)
+                else:
+                    failed.append(name)
+                    logger.error("Failed to connect to %s: %s", name, result)
+            connected = len(names) - len(failed)
+            if not failed:
+                self.notify(f"✅ Connected to {connected}/{len(names)} databases", severity="success")
+            else:
+                self.notify(
+                    f"❌ Connected to {connected}/{len(names)} databases, failed: {', '.join(failed)}",
+                    severity="error" if not connected else "warning"
+                )
             
-            # Databases will connect when their tabs are activated
-            self.notify("Click on a database tab to connect", severity="information")
+            # Keep the warmed pools alive and reconnect dropped ones in the background
+            self.connection_manager.start_health_checks()
             return
         
         # Fall back to DATABASE_URL environment variable
         db_url = os.environ.get('DATABASE_URL')
         if not db_url:
             # Show help
-            help_tab = TabPane("No Database", Static(
-                "No databases.yaml found and DATABASE_URL not set.\n\n"
-                "Please either:\n"
-                "1. Create a databases.yaml file with your database configurations\n"
-                "2. Set the DATABASE_URL environment variable"
-            ))
+            help_tab = TabPane("No Database", Static(NO_DATABASE_TEXT))
             self.tabbed_content.add_pane(help_tab)
             return
         
@@ -1172,10 +1522,10 @@ class PgAdminTUI(App):
             'password': parsed.password or '',
         }
         
-        logger.info(f"Database config: {db_config['host']}:{db_config['port']}/{db_config['database']}")
+        logger.info("Database config: %s:%s/%s", db_config['host'], db_config['port'], db_config['database'])
         
         # Add to connection manager
-        config = DatabaseConfig(**db_config)
+        config = DatabaseConfig.from_dict(db_config)
         self.connection_manager.add_database(config)
         
         # Connect
@@ -1186,6 +1536,7 @@ class PgAdminTUI(App):
         if result:
             self.notify("✅ Connected successfully", severity="success")
             logger.info("Connected successfully")
+            self.connection_manager.start_health_checks()
             
             # Switch to this database
             self.connection_manager.switch_database('default')
@@ -1204,225 +1555,242 @@ class PgAdminTUI(App):
             self.notify("❌ Connection failed", severity="error")
             logger.error("Connection failed")
     
+    def _active_database_tab(self) -> Optional["DatabaseTab"]:
+        """Return the active pane if it is a database tab, else None."""
+        tabbed_content = self.tabbed_content
+        if tabbed_content is None:
+            return None
+        pane = tabbed_content.active_pane
+        return pane if isinstance(pane, DatabaseTab) else None
+    
     async def on_table_selected(self, event: TableSelected) -> None:
         """Handle table selection."""
-        logger.info(f"Table selected: {event.schema}.{event.table}")
+        logger.info("Table selected: %s.%s", event.schema, event.table)
         
-        # Get active tab to check for sorting and filtering
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        # Use the tab that posted the event: a debounced re-run may arrive after
+        # the user switched tabs
+        active_pane = event.tab if event.tab is not None else self._active_database_tab()
         
-        if isinstance(active_pane, DatabaseTab):
-            # Build query with filters and sorting
-            query = f"SELECT * FROM {event.schema}.{event.table}"
-            
+        if active_pane is not None:
             # Add WHERE clause if filters are active
+            where_clause, filter_params = "", None
             if active_pane.filter_state and active_pane.filter_state.has_filters():
                 where_clause, filter_params = active_pane.filter_state.to_sql_where()
-                if where_clause:
-                    query += f" WHERE {where_clause}"
-                    logger.info(f"Added WHERE clause to query: {where_clause}")
-                    logger.info(f"Filter params for query: {filter_params}")
-                    # Store params to pass to execute_query
-                    active_pane._filter_params = filter_params
-            
-            # Add ORDER BY if sorting
-            if active_pane.sort_column:
-                query += f' ORDER BY "{active_pane.sort_column}" {active_pane.sort_direction}'
+            if where_clause:
+                logger.info("Added WHERE clause to query: %s", where_clause)
+                logger.info("Filter params for query: %s", filter_params)
             
-            # Add LIMIT
-            query += " LIMIT 100"
+            # Build query with filters and sorting
+            query = _build_select(
+                event.schema, event.table, where_clause,
+                active_pane.sort_column, active_pane.sort_direction
+            )
         else:
             # Default query
-            query = f"SELECT * FROM {event.schema}.{event.table} LIMIT 100"
+            query, filter_params = _build_select(event.schema, event.table), None
         
-        await self.execute_query(query, is_manual=False)
+        await self.execute_query(query, is_manual=False, preserve_sort=event.rerun,
+                                 filter_params=filter_params, pane=active_pane)
     
-    async def execute_query_with_params(self, query: str, params: list = None, is_manual: bool = False, preserve_sort: bool = False) -> None:
+    async def execute_query_with_params(self, query: str, params: list = None, is_manual: bool = False, preserve_sort: bool = False,
+                                        pane: Optional["DatabaseTab"] = None) -> None:
         """Execute a query with parameters (for filtered manual queries)."""
         # This is a wrapper that passes params through to the main execute_query
-        await self.execute_query(query, is_manual=is_manual, preserve_sort=preserve_sort, filter_params=params)
+        await self.execute_query(query, is_manual=is_manual, preserve_sort=preserve_sort, filter_params=params, pane=pane)
     
-    async def execute_query(self, query: str = None, is_manual: bool = False, preserve_sort: bool = False, filter_params: list = None) -> None:
+    async def execute_query(self, query: str = None, is_manual: bool = False, preserve_sort: bool = False, filter_params: list = None,
+                            pane: Optional["DatabaseTab"] = None) -> None:
         """Execute a SQL query.
         
         Args:
             query: The SQL query to execute (if None, get from query_input)
             is_manual: True if this is a manually typed query (from Ctrl+Enter)
             preserve_sort: True if we should preserve existing sort state (for re-execution with sorting)
-            filter_params: Parameters for filtered queries
+            filter_params: Parameters for the query's placeholders (filtered table or manual queries)
+            pane: The tab to run the query on and render into (defaults to the active tab)
         """
-        # Get active tab
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        active_pane = pane if pane is not None else self._active_database_tab()
         
-        if not isinstance(active_pane, DatabaseTab):
+        if active_pane is None:
             return
         
         # Get query from input if not provided
         if query is None and active_pane.query_input:
+            # A query taken from the input is always a manual query
             query = active_pane.query_input.text
-            # If we're getting the query from input and it wasn't passed in,
-            # this is likely a manual query (unless it came from table selection)
-            if not hasattr(active_pane, '_filter_params'):
-                is_manual = True
+            is_manual = True
         
-        if not query or query.startswith('--'):
+        # Ignore empty or comment-only input before doing any work
+        stripped = query.lstrip() if query else ""
+        if not stripped or stripped.startswith('--'):
             return
         
-        logger.info(f"[EXECUTE] Executing query: {query[:100]}... (manual={is_manual})")
+        logger.info("[EXECUTE] Executing query: %s... (manual=%s)", stripped[:100], is_manual)
         self.notify("Executing query...")
         
+        # Settle params and the tab's manual-query state now, while scheduling: the
+        # worker may start later or be cancelled by a newer query on this tab
+        params = filter_params if filter_params else []
+        
+        # Log current state
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[STATE] Current table: %s", active_pane.current_table)
+            logger.info("[STATE] Has filters: %s", active_pane.filter_state.has_filters() if active_pane.filter_state else False)
+            logger.info("[STATE] Sort column: %s, direction: %s", active_pane.sort_column, active_pane.sort_direction)
+            if is_manual:
+                logger.info("[STATE] Manual filters: %s", active_pane.manual_filter_state.get_filter_count() if active_pane.manual_filter_state else 0)
+        
+        # Only apply filters if this is NOT a manual query (manual queries pass params directly)
+        if not is_manual:
+            if params:
+                logger.info("[FILTERS] Using filter params: %s", params)
+        else:
+            logger.info("[MANUAL] Manual query - not applying any filters or sorting")
+            logger.info("[MANUAL] Final query being executed: %s", query[:200])
+            # Clear current table info since this is a manual query
+            # This prevents sort/filter operations from applying to the wrong table
+            active_pane.current_table = None
+            active_pane.sort_column = None
+            active_pane.sort_direction = "ASC"
+            active_pane.filter_state = None
+            
+            # Store the manual query for potential re-execution with sorting/filtering
+            # Only reset sort/filter info if this is a new manual query (not a re-execution)
+            if not preserve_sort:
+                # Store the base query (without ORDER BY/WHERE that might have been added)
+                # We'll store the original query from query_input if available
+                if not active_pane.manual_query or active_pane.manual_query != query:
+                    active_pane.manual_query = query
+                    # Parse column aliases from the query
+                    active_pane.manual_column_aliases = active_pane.parse_column_aliases(query)
+                    logger.info("[MANUAL] Parsed aliases: %s", active_pane.manual_column_aliases)
+                active_pane.manual_sort_column = None
+                active_pane.manual_sort_direction = "ASC"
+                # Initialize filter state for manual queries
+                if not active_pane.manual_filter_state:
+                    from src.core.filter_manager import FilterState
+                    active_pane.manual_filter_state = FilterState()
+                active_pane.manual_filter_state.clear_all()
+                logger.info("[MANUAL] Stored new manual query for potential sorting/filtering")
+            else:
+                logger.info("[MANUAL] Re-executing manual query with sort: %s %s", active_pane.manual_sort_column, active_pane.manual_sort_direction)
+                if active_pane.manual_filter_state:
+                    logger.info("[MANUAL] Active filters: %s", active_pane.manual_filter_state.get_filter_count())
+        
+        # The driver takes params as a tuple
+        if params and isinstance(params, list):
+            params = tuple(params)
+        
+        # Run in a worker so the UI keeps handling input while the query runs and the
+        # table fills; a newer query on the same tab cancels the one still in flight
+        self.run_worker(
+            self._run_query(active_pane, query, params, is_manual, use_cache=preserve_sort),
+            exclusive=True,
+            group=f"query-{active_pane.connection_name}"
+        )
+    
+    async def _run_query(self, active_pane: "DatabaseTab", query: str, params: Optional[tuple],
+                         is_manual: bool, use_cache: bool) -> None:
+        """Execute a query and render its results into the tab's data table.
+        
+        Everything the query depends on comes in as arguments, settled when the
+        worker was scheduled.
+        """
         try:
-            # Check if we have stored filter params from on_table_selected or passed directly
-            params = filter_params if filter_params else []
-            
-            # Log current state
-            if active_pane:
-                logger.info(f"[STATE] Current table: {active_pane.current_table}")
-                logger.info(f"[STATE] Has filters: {active_pane.filter_state.has_filters() if active_pane.filter_state else False}")
-                logger.info(f"[STATE] Sort column: {active_pane.sort_column}, direction: {active_pane.sort_direction}")
-                if is_manual:
-                    logger.info(f"[STATE] Manual filters: {active_pane.manual_filter_state.get_filter_count() if active_pane.manual_filter_state else 0}")
-            
-            # Only apply filters if this is NOT a manual query (manual queries pass params directly)
-            if not is_manual and not filter_params:
-                if hasattr(active_pane, '_filter_params'):
-                    params = active_pane._filter_params
-                    delattr(active_pane, '_filter_params')
-                    logger.info(f"[FILTERS] Using stored filter params: {params}")
-                elif active_pane and active_pane.filter_state and active_pane.filter_state.has_filters():
-                    # For non-manual queries from table selection, we might need to extract params
-                    # if the query already has WHERE clause built in on_table_selected
-                    if "WHERE" in query.upper() and "SELECT * FROM pg_tables" not in query:
-                        _, params = active_pane.filter_state.to_sql_where()
-                        logger.info(f"[FILTERS] Extracted {len(params)} filter parameters from state")
+            logger.info("[FINAL] Executing with query: %s... params: %s", query[:100], params)
+            if is_manual:
+                # Manual queries may lack a LIMIT - only pull what can be displayed
+                # (plus one row to tell whether the result was truncated)
+                results = await self.connection_manager.execute_query_stream(
+                    query, params if params else None, limit=MAX_DISPLAY_ROWS + 1,
+                    database=active_pane.connection_name
+                )
             else:
-                logger.info("[MANUAL] Manual query - not applying any filters or sorting")
-                logger.info(f"[MANUAL] Final query being executed: {query[:200]}")
-                # Clear current table info since this is a manual query
-                # This prevents sort/filter operations from applying to the wrong table
-                active_pane.current_table = None
-                active_pane.sort_column = None
-                active_pane.sort_direction = "ASC"
-                active_pane.filter_state = None
-                
-                # Store the manual query for potential re-execution with sorting/filtering
-                # Only reset sort/filter info if this is a new manual query (not a re-execution)
-                if not preserve_sort:
-                    # Store the base query (without ORDER BY/WHERE that might have been added)
-                    # We'll store the original query from query_input if available
-                    if not active_pane.manual_query or active_pane.manual_query != query:
-                        active_pane.manual_query = query
-                        # Parse column aliases from the query
-                        active_pane.manual_column_aliases = active_pane.parse_column_aliases(query)
-                        logger.info(f"[MANUAL] Parsed aliases: {active_pane.manual_column_aliases}")
-                    active_pane.manual_sort_column = None
-                    active_pane.manual_sort_direction = "ASC"
-                    # Initialize filter state for manual queries
-                    if not active_pane.manual_filter_state:
-                        from src.core.filter_manager import FilterState
-                        active_pane.manual_filter_state = FilterState()
-                    active_pane.manual_filter_state.clear_all()
-                    logger.info("[MANUAL] Stored new manual query for potential sorting/filtering")
-                else:
-                    logger.info(f"[MANUAL] Re-executing manual query with sort: {active_pane.manual_sort_column} {active_pane.manual_sort_direction}")
-                    if active_pane.manual_filter_state:
-                        logger.info(f"[MANUAL] Active filters: {active_pane.manual_filter_state.get_filter_count()}")
-            
-            # Execute query - convert params list to tuple if needed
-            if params and isinstance(params, list):
-                params = tuple(params)
-            
-            logger.info(f"[FINAL] Executing with query: {query[:100]}... params: {params}")
-            results = await self.connection_manager.execute_query(query, params if params else None)
+                # Table browsing reuses the same statement text, so let the driver
+                # prepare it. A sort/filter re-run often repeats a recent query
+                # exactly; a fresh selection always reads current rows.
+                results = await self.connection_manager.execute_query(
+                    query, params if params else None,
+                    database=active_pane.connection_name, prepare=True, use_cache=use_cache
+                )
             
             # Clear and update data table
             if active_pane.data_table:
-                active_pane.data_table.clear(columns=True)
-                active_pane.column_map.clear()  # Clear the column mapping
-                
                 if results:
-                    # Add columns with sortable and filterable headers
+                    # Build sortable and filterable headers - show indicators for
+                    # both table and manual queries
                     columns = list(results[0].keys())
-                    for i, col in enumerate(columns):
-                        # Build header with indicators
-                        header = col
-                        
-                        # Show indicators for both table and manual queries
-                        if active_pane.current_table:
-                            # Table query - show sort and filter indicators
-                            if active_pane.sort_column == col:
-                                indicator = " ▼" if active_pane.sort_direction == "DESC" else " ▲"
-                                header = f"{col}{indicator}"
-                            
-                            # Add filter indicator if filtered
-                            if active_pane.filter_state:
-                                if col in active_pane.filter_state.filters:
-                                    active_filters = [f for f in active_pane.filter_state.filters[col] if f.enabled]
-                                    if active_filters:
-                                        header = f"{header} [F]"  # Use [F] as filter indicator
-                        elif active_pane.manual_query:
-                            # Manual query - show sort and filter indicators
-                            if active_pane.manual_sort_column == col:
-                                indicator = " ▼" if active_pane.manual_sort_direction == "DESC" else " ▲"
-                                header = f"{col}{indicator}"
-                            
-                            # Add filter indicator if filtered
-                            if active_pane.manual_filter_state:
-                                if col in active_pane.manual_filter_state.filters:
-                                    active_filters = [f for f in active_pane.manual_filter_state.filters[col] if f.enabled]
-                                    if active_filters:
-                                        header = f"{header} [F]"  # Use [F] as filter indicator
-                        
-                        # Add hint about filtering
-                        header = f"{header}"  # Column name with indicators
-                        
-                        # Add column - use index as key to avoid issues
-                        active_pane.data_table.add_column(header, key=str(i))
-                        # Store column name by index for easier lookup
-                        active_pane.column_map[str(i)] = col
+                    if active_pane.current_table:
+                        sort_column = active_pane.sort_column
+                        sort_direction = active_pane.sort_direction
+                        filter_state = active_pane.filter_state
+                    elif active_pane.manual_query:
+                        sort_column = active_pane.manual_sort_column
+                        sort_direction = active_pane.manual_sort_direction
+                        filter_state = active_pane.manual_filter_state
+                    else:
+                        sort_column, sort_direction, filter_state = None, "ASC", None
+                    filtered_cols = {
+                        c for c, fs in filter_state.filters.items() if any(f.enabled for f in fs)
+                    } if filter_state else set()
+                    # Start from the bare names and only decorate the sorted/filtered columns
+                    headers = list(columns)
+                    if sort_column or filtered_cols:
+                        arrow = _SORT_INDICATORS.get(sort_direction, " ▲")
+                        for i, col in enumerate(columns):
+                            if col == sort_column:
+                                headers[i] += arrow
+                            if col in filtered_cols:
+                                headers[i] += _FILTER_INDICATOR
                     
-                    # Add rows (limit display)
-                    for row in results[:1000]:
-                        display_row = []
-                        for col in columns:
-                            val = row[col]
-                            if val is None:
-                                display_row.append("[dim]NULL[/dim]")
-                            elif isinstance(val, bytes):
-                                # Format bytea columns - show full hex string with 0x prefix
-                                if len(val) == 0:
-                                    display_row.append("0x (empty)")
-                                else:
-                                    hex_str = val.hex()
-                                    # Display full hex string with 0x prefix, no truncation
-                                    display_row.append(f"0x{hex_str}")
-                            else:
-                                display_row.append(str(val)[:100])
-                        active_pane.data_table.add_row(*display_row)
+                    if columns and columns == active_pane.column_names:
+                        # Same result columns as last time (e.g. a sort/filter re-run):
+                        # keep the column widgets and only refresh the indicators.
+                        # Widths restart from the header, since the old rows are gone;
+                        # adding the new rows widens them as needed.
+                        active_pane.data_table.clear()
+                        for column, header in zip(active_pane.data_table.columns.values(), headers):
+                            label = Text.from_markup(header)
+                            column.label = label
+                            column.content_width = label.cell_len
+                    else:
+                        active_pane.data_table.clear(columns=True)
+                        for i, header in enumerate(headers):
+                            # Add column - use index as key to avoid issues
+                            active_pane.data_table.add_column(header, key=str(i))
+                        # Store column names by index for easier lookup
+                        active_pane.column_names = columns
+                    
+                    # Add rows (limit display) - rows are dicts in column order,
+                    # so walk values() rather than looking each column up by name.
+                    # Rows go in by chunks, yielding in between, so the first page
+                    # paints before the remaining rows have been formatted.
+                    format_cell = _format_cell
+                    add_rows = active_pane.data_table.add_rows
+                    total = len(results)
+                    shown = results if total <= MAX_DISPLAY_ROWS else results[:MAX_DISPLAY_ROWS]
+                    for start in range(0, len(shown), ROW_CHUNK_SIZE):
+                        if start:
+                            await asyncio.sleep(0)
+                        add_rows([
+                            list(map(format_cell, row.values()))
+                            for row in shown[start:start + ROW_CHUNK_SIZE]
+                        ])
                     
                     # Show appropriate message with filter details
-                    msg_parts = [f"Query returned {len(results)} rows"]
+                    if total > MAX_DISPLAY_ROWS:
+                        msg_parts = [f"Query returned more than {MAX_DISPLAY_ROWS} rows (showing first {MAX_DISPLAY_ROWS})"]
+                    else:
+                        msg_parts = [f"Query returned {total} rows"]
                     
                     # Check if this is a manual query
                     if not active_pane.current_table:
                         msg_parts.append("(manual query)")
                         
                         # Add filter info for manual queries
-                        if active_pane.manual_filter_state and active_pane.manual_filter_state.has_filters():
-                            filter_count = active_pane.manual_filter_state.get_filter_count()
-                            filtered_cols = list(active_pane.manual_filter_state.filters.keys())
-                            
-                            if filter_count == 1:
-                                # Show the single filter
-                                col = filtered_cols[0]
-                                filter = active_pane.manual_filter_state.filters[col][0]
-                                msg_parts.append(f"filtered by {col} {filter.operator.value}")
-                            else:
-                                # Show count and columns
-                                cols_str = ", ".join(filtered_cols[:3])  # Show first 3 columns
-                                if len(filtered_cols) > 3:
-                                    cols_str += f", +{len(filtered_cols) - 3} more"
-                                msg_parts.append(f"{filter_count} filters on: {cols_str}")
+                        filter_summary = active_pane.manual_filter_state.summary() if active_pane.manual_filter_state else ""
+                        if filter_summary:
+                            msg_parts.append(filter_summary)
                         
                         # Add sort info for manual queries
                         if active_pane.manual_sort_column:
@@ -1430,21 +1798,9 @@ class PgAdminTUI(App):
                             msg_parts.append(f"sorted by {active_pane.manual_sort_column} ({direction})")
                     else:
                         # Add filter summary for table queries
-                        if active_pane.filter_state and active_pane.filter_state.has_filters():
-                            filter_count = active_pane.filter_state.get_filter_count()
-                            filtered_cols = list(active_pane.filter_state.filters.keys())
-                            
-                            if filter_count == 1:
-                                # Show the single filter
-                                col = filtered_cols[0]
-                                filter = active_pane.filter_state.filters[col][0]
-                                msg_parts.append(f"filtered by {col} {filter.operator.value}")
-                            else:
-                                # Show count and columns
-                                cols_str = ", ".join(filtered_cols[:3])  # Show first 3 columns
-                                if len(filtered_cols) > 3:
-                                    cols_str += f", +{len(filtered_cols) - 3} more"
-                                msg_parts.append(f"{filter_count} filters on: {cols_str}")
+                        filter_summary = active_pane.filter_state.summary() if active_pane.filter_state else ""
+                        if filter_summary:
+                            msg_parts.append(filter_summary)
                         
                         # Add sort info
                         if active_pane.sort_column:
@@ -1453,37 +1809,43 @@ class PgAdminTUI(App):
                     
                     self.notify(" | ".join(msg_parts), severity="success")
                 else:
+                    active_pane.data_table.clear(columns=True)
+                    active_pane.column_names = []
                     active_pane.data_table.add_column("Result")
                     active_pane.data_table.add_row("No results")
                     
         except Exception as e:
-            logger.error(f"Query error: {e}")
+            logger.error("Query error: %s", e)
             self.notify(f"Query error: {e}", severity="error")
             
             if active_pane.data_table:
                 active_pane.data_table.clear(columns=True)
+                active_pane.column_names = []
                 active_pane.data_table.add_column("Error")
                 active_pane.data_table.add_row(str(e))
     
     async def action_refresh(self) -> None:
         """Refresh the current tab."""
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
-        if isinstance(active_pane, DatabaseTab):
-            await active_pane.refresh_tree()
+        active_pane = self._active_database_tab()
+        if active_pane is not None:
+            # Column types and cached results may be stale along with the catalog
+            active_pane.column_types.clear()
+            self.connection_manager.invalidate_results(active_pane.connection_name)
+            await active_pane.refresh_tree(clear_cache=True)
     
     async def action_execute_query(self) -> None:
         """Execute the current query."""
         # This is a manual query execution (via Ctrl+Enter)
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
-        if isinstance(active_pane, DatabaseTab) and active_pane.query_input:
-            logger.info(f"[MANUAL QUERY] User pressed Ctrl+Enter with query: {active_pane.query_input.text[:100]}")
+        active_pane = self._active_database_tab()
+        if active_pane is not None and active_pane.query_input:
+            logger.info("[MANUAL QUERY] User pressed Ctrl+Enter with query: %s", active_pane.query_input.text[:100])
         await self.execute_query(is_manual=True)
     
     async def action_sort_column(self) -> None:
         """Sort by current column in DataTable."""
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        active_pane = self._active_database_tab()
         
-        if not isinstance(active_pane, DatabaseTab):
+        if active_pane is None:
             return
         
         if not active_pane.data_table:
@@ -1498,7 +1860,7 @@ class PgAdminTUI(App):
         # Get the current cursor column
         if active_pane.data_table.cursor_column >= 0:
             # Get column at cursor position - use index to look up name
-            column_name = active_pane.column_map.get(str(active_pane.data_table.cursor_column))
+            column_name = active_pane.column_name_at(active_pane.data_table.cursor_column)
             
             if not column_name:
                 self.notify("Could not determine column name", severity="warning")
@@ -1514,7 +1876,7 @@ class PgAdminTUI(App):
                     active_pane.manual_sort_direction = "ASC"
                 
                 # Re-execute query with sorting
-                await active_pane.execute_sorted_manual_query()
+                active_pane.reexecute()
             else:
                 # Handle sorting for table query
                 # Toggle sort direction if same column, otherwise reset
@@ -1525,13 +1887,13 @@ class PgAdminTUI(App):
                     active_pane.sort_direction = "ASC"
                 
                 # Re-execute query with sorting
-                await active_pane.execute_sorted_query()
+                active_pane.reexecute()
     
     async def action_filter(self) -> None:
         """Open filter dialog for current column."""
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        active_pane = self._active_database_tab()
         
-        if not isinstance(active_pane, DatabaseTab):
+        if active_pane is None:
             return
         
         if not active_pane.data_table:
@@ -1545,7 +1907,7 @@ class PgAdminTUI(App):
         
         # Get current cursor column
         if active_pane.data_table.cursor_column >= 0:
-            column_name = active_pane.column_map.get(str(active_pane.data_table.cursor_column))
+            column_name = active_pane.column_name_at(active_pane.data_table.cursor_column)
             
             if not column_name:
                 self.notify("Could not determine column name", severity="warning")
@@ -1569,18 +1931,20 @@ class PgAdminTUI(App):
                     table_key = f"{active_pane.current_table['schema']}.{active_pane.current_table['name']}"
                     active_pane.filter_state = active_pane.filter_manager.get_state(table_key)
                 
-                # Detect column types if not cached
-                if column_name not in active_pane.column_types:
+                # Detect column types once per table
+                type_key = (active_pane.current_table['schema'], active_pane.current_table['name'])
+                types = active_pane.column_types.get(type_key)
+                if types is None:
                     types = await active_pane.filter_manager.detect_column_types(
-                        self.connection_manager,
-                        active_pane.current_table['schema'],
-                        active_pane.current_table['name']
+                        self.connection_manager, *type_key,
+                        database=active_pane.connection_name
                     )
-                    active_pane.column_types = types
+                    if types:  # Don't cache a failed detection
+                        active_pane.column_types[type_key] = types
                 
                 # Get data type
                 from src.core.filter_manager import DataType
-                data_type = active_pane.column_types.get(column_name, DataType.OTHER)
+                data_type = types.get(column_name, DataType.OTHER)
                 filter_state = active_pane.filter_state
             
             # Get existing filter for this column if any
@@ -1589,12 +1953,12 @@ class PgAdminTUI(App):
                 filters = filter_state.filters[column_name]
                 if filters and len(filters) > 0:
                     existing_filter = filters[0]  # Get first filter for this column
-                    logger.info(f"Found existing filter for {column_name}: {existing_filter.operator.value} {existing_filter.value}")
+                    logger.info("Found existing filter for %s: %s %s", column_name, existing_filter.operator.value, existing_filter.value)
             
             # Define callback for when filter is applied or cleared
             async def on_filter_applied(col, filter):
                 try:
-                    logger.info(f"Filter callback called for {col}, filter={filter}")
+                    logger.info("Filter callback called for %s, filter=%s", col, filter)
                     
                     # Determine if this is for manual or table query
                     is_manual = active_pane.manual_query is not None
@@ -1604,14 +1968,11 @@ class PgAdminTUI(App):
                     if filter is None:
                         # Remove all filters for this column
                         if col in current_filter_state.filters:
-                            del current_filter_state.filters[col]
-                            logger.info(f"Cleared filter for {col}")
+                            current_filter_state.remove_filter(col)
+                            logger.info("Cleared filter for %s", col)
                             
                             # Re-execute query
-                            if is_manual:
-                                await active_pane.execute_filtered_manual_query()
-                            else:
-                                await active_pane.execute_sorted_query()
+                            active_pane.reexecute()
                             
                             # Show remaining filter count
                             filter_count = current_filter_state.get_filter_count()
@@ -1622,22 +1983,29 @@ class PgAdminTUI(App):
                         else:
                             self.notify(f"No filter to clear for {col}", severity="information")
                     else:
+                        # Re-confirming the filter already in place needs no new query
+                        current = current_filter_state.filters.get(col)
+                        if (current and len(current) == 1 and current[0].enabled
+                                and current[0].operator == filter.operator
+                                and current[0].value == filter.value
+                                and current[0].case_sensitive == filter.case_sensitive):
+                            self.notify(f"Filter unchanged for {col}", severity="information")
+                            return
+                        
                         # Remove existing filters for this column (replace, not add)
                         if col in current_filter_state.filters:
-                            current_filter_state.filters[col] = []
-                            logger.info(f"Cleared existing filters for {col}")
+                            current_filter_state.remove_filter(col)
+                            logger.info("Cleared existing filters for %s", col)
                         
                         # Add new filter
                         current_filter_state.add_filter(col, filter)
-                        logger.info(f"Filter added: {col} {filter.operator.value} {filter.value}")
-                        logger.info(f"Active filters: {current_filter_state.get_filter_count()}")
-                        logger.info(f"All filtered columns: {list(current_filter_state.filters.keys())}")
+                        logger.info("Filter added: %s %s %s", col, filter.operator.value, filter.value)
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("Active filters: %s", current_filter_state.get_filter_count())
+                            logger.info("All filtered columns: %s", list(current_filter_state.filters.keys()))
                         
                         # Re-execute query
-                        if is_manual:
-                            await active_pane.execute_filtered_manual_query()
-                        else:
-                            await active_pane.execute_sorted_query()
+                        active_pane.reexecute()
                         
                         # Show summary of all active filters
                         filter_count = current_filter_state.get_filter_count()
@@ -1648,7 +2016,7 @@ class PgAdminTUI(App):
                             self.notify(f"Filter applied to {col} on {query_type}", severity="success")
                         
                 except Exception as e:
-                    logger.error(f"Error in filter callback: {e}", exc_info=True)
+                    logger.error("Error in filter callback: %s", e, exc_info=True)
                     self.notify(f"Error applying filter: {e}", severity="error")
             
             # Show filter dialog with existing filter if any
@@ -1659,9 +2027,9 @@ class PgAdminTUI(App):
     
     async def action_quick_filter(self) -> None:
         """Open quick filter for text search across all columns."""
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        active_pane = self._active_database_tab()
         
-        if not isinstance(active_pane, DatabaseTab):
+        if active_pane is None:
             return
         
         if not active_pane.current_table:
@@ -1673,9 +2041,9 @@ class PgAdminTUI(App):
     
     async def action_clear_filters(self) -> None:
         """Clear all active filters."""
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        active_pane = self._active_database_tab()
         
-        if not isinstance(active_pane, DatabaseTab):
+        if active_pane is None:
             return
         
         # Check for manual query filters
@@ -1683,22 +2051,22 @@ class PgAdminTUI(App):
             count = active_pane.manual_filter_state.get_filter_count()
             active_pane.manual_filter_state.clear_all()
             # Re-execute the manual query without filters
-            await active_pane.execute_sorted_manual_query()
+            active_pane.reexecute()
             self.notify(f"Cleared {count} filters from manual query", severity="success")
         # Check for table query filters
         elif active_pane.filter_state and active_pane.filter_state.has_filters():
             count = active_pane.filter_state.get_filter_count()
             active_pane.filter_state.clear_all()
-            await active_pane.execute_sorted_query()
+            active_pane.reexecute()
             self.notify(f"Cleared {count} filters", severity="success")
         else:
             self.notify("No active filters to clear", severity="information")
     
     async def action_export(self) -> None:
         """Export current data to file."""
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        active_pane = self._active_database_tab()
         
-        if not isinstance(active_pane, DatabaseTab):
+        if active_pane is None:
             return
         
         if not active_pane.data_table:
@@ -1724,11 +2092,7 @@ class PgAdminTUI(App):
             table_name = "manual_query"
             
             # Check for existing LIMIT in the query
-            import re
-            query = active_pane.manual_query.rstrip().rstrip(';')
-            limit_match = re.search(r'\s+LIMIT\s+(\d+)\s*$', query, re.IGNORECASE)
-            if limit_match:
-                existing_limit = int(limit_match.group(1))
+            _, _, existing_limit = _split_limit(active_pane.manual_query)
         elif active_pane.current_table:
             # Table query
             has_filters = active_pane.filter_state and active_pane.filter_state.has_filters()
@@ -1767,10 +2131,13 @@ class PgAdminTUI(App):
     
     async def _perform_export(self, active_pane, filepath: str, options, is_manual: bool):
         """Perform the actual export operation."""
-        from src.core.export_manager import ExportManager, ExportFormat
+        from src.core.export_manager import ExportManager
         from src.ui.widgets.progress_dialog import ProgressDialog
         
         progress_dialog = None
+        data = None
+        export_started = False  # The target file has been opened for writing
+        completed = False  # ...and holds a finished export worth keeping
         
         try:
             # Validate filepath
@@ -1792,7 +2159,7 @@ class PgAdminTUI(App):
             # Check if file exists and warn about overwrite
             if os.path.exists(filepath):
                 # In a real app, we'd show a confirmation dialog here
-                logger.warning(f"File {filepath} will be overwritten")
+                logger.warning("File %s will be overwritten", filepath)
             
             self.notify("Gathering data for export...", severity="information")
             
@@ -1803,83 +2170,84 @@ class PgAdminTUI(App):
                 # Apply max_rows limit if specified
                 if options.max_rows and len(data) > options.max_rows:
                     data = data[:options.max_rows]
-                    logger.info(f"Limited filtered data to {options.max_rows} rows for export")
+                    logger.info("Limited filtered data to %s rows for export", options.max_rows)
+                expected_rows = len(data)
+                
+                if not data:
+                    self.notify("No data to export", severity="warning")
+                    return
             else:
                 # Get original data without filters/sorting
                 if is_manual:
-                    # Re-execute original manual query
-                    query = active_pane.manual_query
-                    
-                    # Handle LIMIT clause
-                    import re
-                    query = query.rstrip().rstrip(';')  # Remove trailing semicolon
-                    
-                    # Check if query already has a LIMIT clause
-                    limit_pattern = r'\s+LIMIT\s+(\d+)\s*$'
-                    limit_match = re.search(limit_pattern, query, re.IGNORECASE)
+                    # Re-execute original manual query, without its trailing
+                    # semicolon and with any trailing LIMIT split off
+                    query, unlimited_query, existing_limit = _split_limit(active_pane.manual_query)
                     
+                    # Only a LIMIT gives the row count away up front
+                    expected_rows = options.max_rows or existing_limit
                     if options.max_rows:
                         # User specified a max_rows in export dialog - use it
-                        if limit_match:
-                            # Replace existing LIMIT with user's choice
-                            query = re.sub(limit_pattern, f' LIMIT {options.max_rows}', query, flags=re.IGNORECASE)
-                            logger.info(f"Replacing existing LIMIT with user's max_rows: {options.max_rows}")
+                        query = f'{unlimited_query} LIMIT {options.max_rows}'
+                        if existing_limit is not None:
+                            logger.info("Replacing existing LIMIT with user's max_rows: %s", options.max_rows)
                         else:
-                            # Add LIMIT with user's choice
-                            query += f' LIMIT {options.max_rows}'
-                            logger.info(f"Adding user's max_rows as LIMIT: {options.max_rows}")
-                    elif not limit_match:
+                            logger.info("Adding user's max_rows as LIMIT: %s", options.max_rows)
+                    elif existing_limit is None:
                         # No user preference and no existing LIMIT - add safety default
                         logger.info("Adding default LIMIT 100000 for export safety")
                         query += " LIMIT 100000"
                     # else: query has LIMIT and user didn't specify max_rows - keep existing LIMIT
                     
-                    data = await self._execute_query_for_export(query)
+                    data = self._execute_query_for_export(query, active_pane.connection_name)
                 else:
                     # Get original table data
                     schema = active_pane.current_table['schema']
                     table = active_pane.current_table['name']
                     query = f'SELECT * FROM "{schema}"."{table}"'
                     
+                    expected_rows = options.max_rows or 100
                     if options.max_rows:
                         # User specified a max_rows in export dialog - use it
                         query += f' LIMIT {options.max_rows}'
-                        logger.info(f"Using user's max_rows for table export: {options.max_rows}")
+                        logger.info("Using user's max_rows for table export: %s", options.max_rows)
                     else:
                         # No user preference - use the table's default LIMIT 100
                         # (matches what's shown in the table view)
                         query += ' LIMIT 100'
                         logger.info("Using table's default LIMIT 100 for export")
                     
-                    data = await self._execute_query_for_export(query)
-            
-            if not data:
-                self.notify("No data to export", severity="warning")
-                return
+                    data = self._execute_query_for_export(query, active_pane.connection_name)
             
-            # Show progress dialog for large exports
-            show_progress = len(data) > 1000
-            if show_progress:
-                progress_dialog = ProgressDialog(title=f"Exporting {len(data)} rows...")
+            async def show_progress_dialog():
+                nonlocal progress_dialog
+                title = f"Exporting up to {expected_rows} rows..." if expected_rows else "Exporting rows..."
+                progress_dialog = ProgressDialog(title=title)
                 self.push_screen(progress_dialog)
                 await asyncio.sleep(0.1)  # Let the dialog render
             
+            # Show progress dialog for large exports. Without a known row count
+            # the dialog opens once the export actually passes the threshold.
+            if expected_rows and expected_rows > 1000:
+                await show_progress_dialog()
+            
             # Create export manager and perform export
             export_manager = ExportManager()
             
-            # Progress callback
+            # Progress callback; progress and total are None when the row count is unknown
             async def progress_callback(progress, current, total):
+                if progress_dialog is None and current > 1000:
+                    await show_progress_dialog()
                 if progress_dialog and not progress_dialog.cancelled:
                     progress_dialog.update_progress(
                         progress,
-                        f"Exporting row {current} of {total}",
+                        f"Exporting row {current} of {total}" if total else f"Exported {current} rows",
                         f"Writing to {os.path.basename(filepath)}"
                     )
                     # Check for cancellation
                     if progress_dialog.cancelled:
                         export_manager.cancel_export()
                         return False
-                elif progress % 10 == 0:  # Update every 10% if no dialog
+                elif progress is not None and progress % 10 == 0:  # Update every 10% if no dialog
                     self.notify(f"Export progress: {progress:.0f}% ({current}/{total} rows)")
                 
                 # Yield control periodically
@@ -1888,16 +2256,14 @@ class PgAdminTUI(App):
                 return True
             
             # Perform export based on format
-            success = False
-            if options.format == ExportFormat.CSV or options.format == ExportFormat.TSV:
-                success = await export_manager.export_to_csv(
-                    data, filepath, options, progress_callback
-                )
-            elif options.format == ExportFormat.JSON:
-                success = await export_manager.export_to_json(
-                    data, filepath, options, progress_callback
-                )
-            elif options.format == ExportFormat.SQL:
+            kind, needs_table = _EXPORTERS.get(options.format.value, (None, False))
+            if kind is None:
+                self.notify(f"Export format {options.format} not yet implemented", severity="error")
+                return
+            
+            exporter = getattr(export_manager, f"export_to_{kind}")
+            export_started = True
+            if needs_table:
                 if is_manual:
                     # For manual queries, use generic table name
                     schema = "public"
@@ -1906,27 +2272,33 @@ class PgAdminTUI(App):
                     schema = active_pane.current_table['schema']
                     table = active_pane.current_table['name']
                 
-                success = await export_manager.export_to_sql(
-                    data, table, schema, filepath, options, progress_callback
+                success = await exporter(
+                    data, table, schema, filepath, options, progress_callback,
+                    total_rows=expected_rows
                 )
             else:
-                self.notify(f"Export format {options.format} not yet implemented", severity="error")
-                return
+                success = await exporter(
+                    data, filepath, options, progress_callback, total_rows=expected_rows
+                )
             
             # Close progress dialog
             if progress_dialog:
                 progress_dialog.close_dialog()
             
-            if success:
-                # Show file size
-                file_size = os.path.getsize(filepath)
-                size_str = self._format_file_size(file_size)
-                self.notify(f"✓ Exported {len(data)} rows to {filepath} ({size_str})", severity="success")
-            else:
+            # A failed or cancelled export is reported first; the row count
+            # only means something for an export that finished
+            if not success:
                 if progress_dialog and progress_dialog.cancelled:
                     self.notify("Export cancelled by user", severity="warning")
                 else:
                     self.notify("Export failed", severity="error")
+            elif not export_manager.rows_exported:
+                self.notify("No data to export", severity="warning")
+            else:
+                completed = True
+                # Show file size, as recorded by the exporter when it finished writing
+                size_str = self._format_file_size(export_manager.bytes_written)
+                self.notify(f"✓ Exported {export_manager.rows_exported} rows to {filepath} ({size_str})", severity="success")
                 
         except PermissionError as e:
             self.notify(f"Permission denied: {e}", severity="error")
@@ -1935,9 +2307,20 @@ class PgAdminTUI(App):
         except MemoryError:
             self.notify("Out of memory - try exporting fewer rows", severity="error")
         except Exception as e:
-            logger.error(f"Export error: {e}", exc_info=True)
+            logger.error("Export error: %s", e, exc_info=True)
             self.notify(f"Export failed: {str(e)}", severity="error")
         finally:
+            # Release the server-side cursor if the export stopped early
+            if data is not None and not isinstance(data, list):
+                await data.aclose()
+            
+            # Don't leave a partial or empty file behind
+            if export_started and not completed:
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+            
             # Make sure to close progress dialog
             if progress_dialog:
                 try:
@@ -1947,11 +2330,9 @@ class PgAdminTUI(App):
     
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Each unit is 2**10 of the previous, so the bit length picks it directly
+        idx = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
     
     async def _get_current_data(self, active_pane) -> list:
         """Get the currently displayed data from the data table."""
@@ -1962,86 +2343,59 @@ class PgAdminTUI(App):
         if not active_pane.data_table:
             return data
         
-        # Use the column_map to get actual column names
-        # The column_map maps column indices to real column names
+        # Resolve each column's real name once, by column index
+        data_table = active_pane.data_table
+        column_keys = list(data_table.columns.keys())
         columns = []
-        column_keys = list(active_pane.data_table.columns.keys())
-        
-        for col_key in column_keys:
-            # Get the real column name from the map
-            if col_key in active_pane.column_map:
-                col_name = active_pane.column_map[col_key]
-            else:
-                # Fallback: parse from label if not in map
-                col = active_pane.data_table.columns[col_key]
-                col_label = str(col.label)
-                # Remove indicators like ▲ ▼ [F]
-                col_label = col_label.replace(" ▲", "").replace(" ▼", "").replace(" [F]", "")
-                col_name = col_label
+        for idx, col_key in enumerate(column_keys):
+            col_name = active_pane.column_name_at(idx)
+            if col_name is None:
+                # Fallback: parse from label if not in the list, removing
+                # indicators like ▲ ▼ [F]
+                col_label = str(data_table.columns[col_key].label)
+                col_name = _HEADER_INDICATOR_RE.sub("", col_label)
             columns.append(col_name)
         
-        # Get row data
-        for row_key in active_pane.data_table.rows:
-            row_data = {}
-            for i, col_key in enumerate(column_keys):
-                cell_value = active_pane.data_table.get_cell(row_key, col_key)
-                # Handle special values
-                if cell_value == "[NULL]":
-                    cell_value = None
-                row_data[columns[i]] = cell_value
-            data.append(row_data)
+        # Get row data, mapping rendered NULL cells back to None
+        get_cell = data_table.get_cell
+        null_cell = _NULL_CELL
+        for row_key in data_table.rows:
+            values = [
+                None if (value := get_cell(row_key, col_key)) == null_cell else value
+                for col_key in column_keys
+            ]
+            data.append(dict(zip(columns, values)))
         
         return data
     
-    async def _execute_query_for_export(self, query: str) -> list:
-        """Execute a query and return results for export."""
-        results = await self.connection_manager.execute_query(query)
-        return results if results else []
+    def _execute_query_for_export(self, query: str, database: Optional[str] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream a query's results for export in batches from a server-side cursor."""
+        return self.connection_manager.iter_query(query, database=database)
     
     async def action_help(self) -> None:
         """Show help."""
-        help_text = """
-Keyboard Shortcuts:
-- Ctrl+Q: Quit
-- Ctrl+Enter: Execute query
-- F3: Export data
-- F4: Filter current column
-- Ctrl+F: Quick filter (search)
-- Alt+F: Clear all filters
-- F5: Refresh tree
-- S: Sort by current column
-- Enter: Select table/view
-- Arrow keys: Navigate
-
-Table Features:
-- Click column headers to sort
-- Press 'S' on a column to sort
-- Press 'F4' on a column to filter
-- ▲ = ascending, ▼ = descending
-- [F] = filter active on column
-"""
-        self.notify(help_text, severity="information", timeout=10)
+        self.notify(HELP_TEXT, severity="information", timeout=10)
     
     async def on_tabbed_content_tab_activated(self, event) -> None:
         """Handle tab activation - connect to database if needed."""
-        active_pane = self.tabbed_content.active_pane if self.tabbed_content else None
+        active_pane = self._active_database_tab()
         
-        if isinstance(active_pane, DatabaseTab):
+        if active_pane is not None:
             # Connect to this database if not already connected
-            conn = self.connection_manager.connections.get(active_pane.connection_name)
+            conn = active_pane.connection
             if conn and conn.status != ConnectionStatus.CONNECTED:
                 self.notify(f"Connecting to {active_pane.connection_name}...")
                 result = await self.connection_manager.connect_database(active_pane.connection_name)
                 if result:
                     self.notify(f"✅ Connected to {active_pane.connection_name}", severity="success")
-                    logger.info(f"Tab activated, connected to {active_pane.connection_name}")
+                    logger.info("Tab activated, connected to %s", active_pane.connection_name)
                 else:
                     self.notify(f"❌ Failed to connect to {active_pane.connection_name}", severity="error")
-                    logger.error(f"Tab activated, connection failed for {active_pane.connection_name}")
+                    logger.error("Tab activated, connection failed for %s", active_pane.connection_name)
                     return
             elif conn and conn.status == ConnectionStatus.CONNECTED:
                 # Already connected
-                logger.info(f"Tab activated, already connected: {active_pane.connection_name}")
+                logger.info("Tab activated, already connected: %s", active_pane.connection_name)
             
             # Switch active connection
             self.connection_manager.switch_database(active_pane.connection_name)
@@ -2068,24 +2422,19 @@ def main(debug, config):
         console_handler.setLevel(logging.DEBUG)
         logging.getLogger().addHandler(console_handler)
         logging.getLogger().setLevel(logging.DEBUG)
-    else:
-        # Ensure no console output in normal mode
-        import sys
-        import os
-        
-        # Suppress stderr temporarily during startup
-        old_stderr = sys.stderr
-        sys.stderr = open(os.devnull, 'w')
     
-    try:
+    with contextlib.ExitStack() as stack:
+        if not debug:
+            # Keep stray output off the screen in normal mode, but record it in
+            # the log file rather than discarding it. This swaps sys.stderr only:
+            # Textual draws through sys.__stderr__, so fd 2 must stay attached
+            # to the terminal.
+            stderr_log = _StderrToLog(logging.getLogger('stderr'))
+            stack.callback(stderr_log.flush)
+            stack.enter_context(contextlib.redirect_stderr(stderr_log))
+        
         app = PgAdminTUI(config_path=config)
         app.run()
-    finally:
-        if not debug:
-            # Restore stderr
-            sys.stderr.close()
-            sys.stderr = old_stderr
-
 
 if __name__ == "__main__":
     main()
@@ -8,6 +8,8 @@ from textual.binding import Binding
 from typing import Dict, List, Any, Optional
 import asyncio
 
+from ...core.connection_manager import ConnectionStatus
+
 
 class DatabaseExplorer(Widget):
     """Tree widget for exploring database objects."""
@@ -35,12 +37,12 @@ class DatabaseExplorer(Widget):
         """Initialize the explorer when mounted."""
         import logging
         logger = logging.getLogger(__name__)
-        logger.info(f"Explorer mounted, connection_manager: {self.connection_manager}")
+        logger.info("Explorer mounted, connection_manager: %s", self.connection_manager)
         
         if self.connection_manager:
             # Check if any connection is active
             conn = self.connection_manager.get_active_connection()
-            if conn and conn.status.value == "connected":
+            if conn and conn.status == ConnectionStatus.CONNECTED:
                 logger.info("Active connection found, refreshing tree")
                 await self.refresh_tree()
             else:
@@ -51,10 +53,10 @@ class DatabaseExplorer(Widget):
         import logging
         logger = logging.getLogger(__name__)
         
-        logger.debug(f"refresh_tree called, connection_manager={self.connection_manager}, tree={self._tree_widget}")
+        logger.debug("refresh_tree called, connection_manager=%s, tree=%s", self.connection_manager, self._tree_widget)
         
         if not self.connection_manager or not self._tree_widget:
-            logger.warning(f"Cannot refresh tree: connection_manager={self.connection_manager}, tree={self._tree_widget}")
+            logger.warning("Cannot refresh tree: connection_manager=%s, tree=%s", self.connection_manager, self._tree_widget)
             return
         
         # Clear existing tree
@@ -62,9 +64,9 @@ class DatabaseExplorer(Widget):
         
         # Get active connection
         conn = self.connection_manager.get_active_connection()
-        logger.debug(f"Active connection: {conn}, status: {conn.status.value if conn else 'None'}")
+        logger.debug("Active connection: %s, status: %s", conn, conn.status.value if conn else 'None')
         
-        if not conn or conn.status.value != "connected":
+        if not conn or conn.status != ConnectionStatus.CONNECTED:
             root = self._tree_widget.root.add("No connection")
             return
         
@@ -74,7 +76,7 @@ class DatabaseExplorer(Widget):
             expand=True
         )
         db_node.data = {"type": "database", "name": conn.config.database}
-        logger.debug(f"Added database node: {conn.config.database}")
+        logger.debug("Added database node: %s", conn.config.database)
         
         # Load schemas
         await self._load_schemas(db_node)
@@ -96,7 +98,7 @@ class DatabaseExplorer(Widget):
         
         try:
             results = await self.connection_manager.execute_query(query)
-            logger.debug(f"Schema query returned {len(results) if results else 0} results")
+            logger.debug("Schema query returned %s results", len(results) if results else 0)
             if results:
                 for row in results:
                     schema_name = row['nspname']
@@ -76,7 +76,7 @@ class ProgressDialog(ModalScreen):
     
     def update_progress(self, progress: float, status: str = None, details: str = None):
         """Update the progress display."""
-        if self.progress_bar:
+        if self.progress_bar and progress is not None:
             self.progress_bar.update(progress=progress)
         
         if status and self.status_label:
@@ -188,7 +188,7 @@ class SimpleFilterDialog(Container):
                 except Exception as e:
                     import logging
                     logger = logging.getLogger(__name__)
-                    logger.warning(f"Could not set operator value: {e}")
+                    logger.warning("Could not set operator value: %s", e)
                     # Select first option if setting existing value fails
                     if options:
                         self.operator_select.value = options[0][1]
@@ -261,7 +261,7 @@ class SimpleFilterDialog(Container):
                 # Invalid operator value, ignore
                 import logging
                 logger = logging.getLogger(__name__)
-                logger.warning(f"Invalid operator value: {event.value}")
+                logger.warning("Invalid operator value: %s", event.value)
                 return
             
             # Show/hide second input for BETWEEN
@@ -320,7 +320,7 @@ class SimpleFilterDialog(Container):
             # Log the filter for debugging
             import logging
             logger = logging.getLogger(__name__)
-            logger.info(f"Applying filter: {self.column} {operator.value} {value}")
+            logger.info("Applying filter: %s %s %s", self.column, operator.value, value)
             
             # Call callback if set
             if self.callback:
@@ -333,7 +333,7 @@ class SimpleFilterDialog(Container):
         except Exception as e:
             import logging
             logger = logging.getLogger(__name__)
-            logger.error(f"Error applying filter: {e}")
+            logger.error("Error applying filter: %s", e)
             self.app.notify(f"Error applying filter: {e}", severity="error")
     
     def clear_filter(self):
@@ -341,7 +341,7 @@ class SimpleFilterDialog(Container):
         try:
             import logging
             logger = logging.getLogger(__name__)
-            logger.info(f"Clearing filter for column: {self.column}")
+            logger.info("Clearing filter for column: %s", self.column)
             
             # Call callback with None to indicate filter should be cleared
             if self.callback:
@@ -356,5 +356,5 @@ class SimpleFilterDialog(Container):
         except Exception as e:
             import logging
             logger = logging.getLogger(__name__)
-            logger.error(f"Error clearing filter: {e}")
+            logger.error("Error clearing filter: %s", e)
             self.app.notify(f"Error clearing filter: {e}", severity="error")
\ No newline at end of file
@@ -147,10 +147,10 @@ class ConfigManager:
             if 'safety' in config:
                 self._update_dataclass(self.safety_config, config['safety'])
             
-            logger.info(f"Configuration loaded from {config_path}")
+            logger.info("Configuration loaded from %s", config_path)
             
         except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
+            logger.error("Failed to load configuration: %s", e)
     
     def load_databases(self, database_file: Optional[str] = None) -> List[Dict[str, Any]]:
         """Load database configurations."""
@@ -182,12 +182,12 @@ class ConfigManager:
                 self.databases = config['databases']
                 # Substitute environment variables
                 self.databases = self._substitute_env_vars(self.databases)
-                logger.info(f"Loaded {len(self.databases)} database configurations")
+                logger.info("Loaded %s database configurations", len(self.databases))
             
             return self.databases
             
         except Exception as e:
-            logger.error(f"Failed to load databases: {e}")
+            logger.error("Failed to load databases: %s", e)
             return self._load_databases_from_env()
     
     def _load_databases_from_env(self) -> List[Dict[str, Any]]:
@@ -311,6 +311,6 @@ class ConfigManager:
         try:
             with open(config_path, 'w') as f:
                 yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-            logger.info(f"Configuration saved to {config_path}")
+            logger.info("Configuration saved to %s", config_path)
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
\ No newline at end of file
+            logger.error("Failed to save configuration: %s", e)
\ No newline at end of file